@@ -4,28 +4,39 @@ import json
 import re
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
+from operator import itemgetter
 
 import cv2
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 os.environ["QT_LOGGING_RULES"] = "qt.multimedia.ffmpeg=false"
 
 from PyQt6.QtCore import (
-    Qt, QSize, QTimer, QUrl, QPoint, QSettings, 
-    QThread, pyqtSignal, QEvent
+    Qt, QSize, QTimer, QUrl, QPoint, QRectF, QSettings, 
+    QThread, pyqtSignal, QEvent, QCoreApplication,
+    QAbstractListModel, QModelIndex, QItemSelection, QItemSelectionModel
 )
 
 from PyQt6.QtGui import (
-    QIcon, QPixmap, QPainter, QColor, QFont, QImage, QDesktopServices
+    QIcon, QPixmap, QPixmapCache, QPainter, QColor, QFont, QImage, QDesktopServices
 )
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QLabel, 
     QStyle, QCheckBox, QDialog, QVBoxLayout, QHBoxLayout, 
-    QListWidget, QListWidgetItem, QLineEdit, QTextEdit, 
+    QListWidget, QListWidgetItem, QListView, QLineEdit, QTextEdit, 
     QMessageBox, QComboBox, QTabWidget, QScrollArea, 
     QFrame, QSizePolicy, QFileDialog, QProgressBar
 )
@@ -55,6 +66,95 @@ def find_catalog_file(filename="catalogo_erros.json"):
     
     return search_paths[0]
 
+# Catálogos já decodificados, por caminho: (mtime_ns, tamanho, dados). Relido só quando o arquivo muda no disco.
+_CATALOG_CACHE = {}
+
+def parse_json_bytes(raw):
+    """ Decodifica o conteúdo bruto de um arquivo JSON (catálogo ou resultados); usa orjson quando instalado e cai para o json da biblioteca padrão. """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_catalog_bytes(data, pretty=False):
+    """ Serializa o catálogo em UTF-8 compacto e com chaves ordenadas; pretty=True indenta com 2 espaços. Mesmo formato com ou sem orjson. """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def write_bytes_atomic(path, payload):
+    """ Grava os bytes em um arquivo temporário ao lado do destino e troca com os.replace, para que uma falha no meio da escrita não corrompa o arquivo. """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def write_json_atomic(path, data):
+    """ Grava JSON indentado (orjson quando disponível) de forma atômica com write_bytes_atomic. """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    write_bytes_atomic(path, payload)
+
+def export_catalog_pretty(destino, origem=None):
+    """ Grava uma cópia indentada do catálogo para leitura ou revisão manual; o arquivo usado pelo programa continua compacto. """
+    origem = origem or find_catalog_file("catalogo_erros.json")
+    data = load_catalog(origem)
+    if data is None:
+        raise FileNotFoundError(f"Catálogo não encontrado ou inválido: {origem}")
+    with open(destino, 'wb') as f:
+        f.write(dump_catalog_bytes(data, pretty=True))
+
+def copy_catalog(data):
+    """ Copia a estrutura do catálogo (listas de nomes e descrições) para que edições locais não alterem o cache. """
+    if not isinstance(data, dict):
+        return data
+    copia = dict(data)
+    if isinstance(data.get("nomes"), list):
+        copia["nomes"] = list(data["nomes"])
+    if isinstance(data.get("descricoes"), dict):
+        copia["descricoes"] = {
+            nome: list(descricoes) if isinstance(descricoes, list) else descricoes
+            for nome, descricoes in data["descricoes"].items()
+        }
+    return copia
+
+def load_catalog(path):
+    """ Retorna uma cópia do catálogo JSON, decodificando o arquivo apenas quando seu mtime/tamanho mudou. Devolve None se não existir ou for inválido. """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _CATALOG_CACHE.pop(path, None)
+        return None
+
+    cached = _CATALOG_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return copy_catalog(cached[2])
+
+    try:
+        with open(path, 'rb') as f:
+            data = parse_json_bytes(f.read())
+    except Exception:
+        _CATALOG_CACHE.pop(path, None)
+        return None
+
+    _CATALOG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy_catalog(data)
+
+def remember_catalog(path, data):
+    """ Atualiza o cache após uma gravação bem-sucedida, evitando reler o arquivo que acabou de ser escrito. """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _CATALOG_CACHE.pop(path, None)
+        return
+    _CATALOG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, copy_catalog(data))
+
 class ColorFiltersDialog(QDialog):
     """ Diálogo não modal que permite ao usuário selecionar e aplicar filtros de processamento de imagem em tempo real. """
     def __init__(self, parent=None):
@@ -129,16 +229,34 @@ class ColorFiltersDialog(QDialog):
 
     def closeEvent(self, event):
         """ Salva a posição da janela antes de fechar. """
-        SETTINGS.setValue("ColorFiltersDialog/pos", self.pos())
+        save_dialog_position(self, "ColorFiltersDialog/pos")
         super().closeEvent(event)
 
     def hideEvent(self, event):
         """ Salva a posição quando a janela é ocultada. """
-        SETTINGS.setValue("ColorFiltersDialog/pos", self.pos())
+        save_dialog_position(self, "ColorFiltersDialog/pos")
         super().hideEvent(event)
 
 SETTINGS = QSettings("BenaproDev", "Benapro")
 
+# Posições de diálogos já lidas/gravadas nesta sessão, evitando ida ao backend do QSettings a cada abertura.
+_DIALOG_POSITIONS = {}
+
+def saved_dialog_position(settings_key):
+    """Retorna a posicao salva do dialogo (ou None), consultando o QSettings apenas na primeira vez."""
+    if settings_key not in _DIALOG_POSITIONS:
+        pos = SETTINGS.value(settings_key, None)
+        _DIALOG_POSITIONS[settings_key] = pos if isinstance(pos, QPoint) else None
+    return _DIALOG_POSITIONS[settings_key]
+
+def save_dialog_position(dialog, settings_key):
+    """Grava a posicao atual do dialogo, ignorando a escrita quando ela nao mudou."""
+    pos = dialog.pos()
+    if _DIALOG_POSITIONS.get(settings_key) == pos:
+        return
+    SETTINGS.setValue(settings_key, pos)
+    _DIALOG_POSITIONS[settings_key] = QPoint(pos)
+
 def center_dialog_on_screen(dialog):
     """Centraliza o dialogo na tela do pai, respeitando a area disponivel."""
     parent = dialog.parentWidget()
@@ -150,8 +268,8 @@ def center_dialog_on_screen(dialog):
 
 def restore_dialog_position(dialog, settings_key, center_if_invalid=True):
     """Restaura a posicao salva apenas se ela ainda estiver visivel."""
-    pos = SETTINGS.value(settings_key, None)
-    if isinstance(pos, QPoint):
+    pos = saved_dialog_position(settings_key)
+    if pos is not None:
         width = max(dialog.width(), 80)
         height = max(dialog.height(), 80)
         for screen in QApplication.screens():
@@ -166,24 +284,64 @@ def restore_dialog_position(dialog, settings_key, center_if_invalid=True):
                 return
 
         SETTINGS.remove(settings_key)
+        _DIALOG_POSITIONS[settings_key] = None
 
     if center_if_invalid:
         center_dialog_on_screen(dialog)
 
+class MediaRec:
+    """ Registro compacto (com __slots__) de uma imagem extraída do ZIP e dos metadados identificados no caminho e no nome do arquivo. """
+    __slots__ = ('file_path', 'filename', 'nome_sem_ext', 'data', 'id', 'dedo', 'frame')
+
+    def __init__(self, file_path, filename, nome_sem_ext, data, id, dedo, frame):
+        self.file_path = file_path
+        self.filename = filename
+        self.nome_sem_ext = nome_sem_ext
+        self.data = data
+        self.id = id
+        self.dedo = dedo
+        self.frame = frame
+
 from functools import partial
 class ZipLoaderThread(QThread):
     """ Thread responsável por extrair o arquivo ZIP em segundo plano e organizar a lista de mídias, evitando o congelamento da interface. """
     progress = pyqtSignal(int, str)  
     finished = pyqtSignal(list) 
     error = pyqtSignal(str) 
+
+    # re.ASCII: nomes de pastas/arquivos só usam dígitos 0-9; o mês já é validado (01..12) pela própria regex.
+    _YEAR_MONTH_RE = re.compile(r'(?<!\d)((?:19|20)\d{2})[ _-]?(0[1-9]|1[0-2])(?!\d)', re.ASCII)
+    _DAY_RE = re.compile(r'\d{1,2}', re.ASCII)
+    _TIMESTAMP_RE = re.compile(r'(?<!\d)(1\d{9}|2\d{9})(?:\.\d+)?(?!\d)', re.ASCII)
+    _FRAME_RE = re.compile(r'_frame_(\d+)', re.IGNORECASE | re.ASCII)
+    _FINGER_MAP = {
+        'dedao': 'Dedão', 'indic': 'Indicador', 
+        'medio': 'Médio', 'anel': 'Anelar', 'mind': 'Mindinho'
+    }
+    _SIDE_MAP = {'d': 'Direita', 'e': 'Esquerda'}
+    # Cada token do nome do arquivo mapeia para (dedo, lado); inclui as formas '1d', '2e' etc.
+    _TOKEN_MAP = {
+        **{token: (finger, None) for token, finger in _FINGER_MAP.items()},
+        **{token: (None, side) for token, side in _SIDE_MAP.items()},
+        **{digit + token: (None, side) for token, side in _SIDE_MAP.items() for digit in '0123456789'},
+    }
+    _VALID_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tif', '.tiff'})
+    # Caminho rápido para str.endswith: extensões em minúsculas e maiúsculas; grafias mistas caem no teste com lower().
+    _EXT_TUPLE = tuple(sorted(_VALID_EXTENSIONS)) + tuple(sorted(ext.upper() for ext in _VALID_EXTENSIONS))
+    COPY_BUFFER_SIZE = 1 << 20
+    PROGRESS_INTERVAL = 0.05
+    EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
     
     def __init__(self, zip_path, temp_dir):
         """ Configura os caminhos de entrada e saída e define as extensões válidas para busca. """
         super().__init__()
         self.zip_path = zip_path
         self.temp_dir = temp_dir
-        self.valid_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tif', '.tiff'}
+        self.valid_extensions = self._VALID_EXTENSIONS
         self.labels_set = {'dedao', 'indic', 'anel', 'medio', 'mind'}
+        self._worker_local = threading.local()
+        self._worker_zips = []
+        self._worker_zips_lock = threading.Lock()
 
     def run(self):
         """ Executa o processo de extração e organização, emitindo sinais de progresso, erro ou conclusão. """
@@ -191,81 +349,154 @@ class ZipLoaderThread(QThread):
             self.progress.emit(0, "Iniciando extração...")
             
             with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                total_files = len(file_list)
-                
-                for i, member in enumerate(file_list):
-                    zip_ref.extract(member, self.temp_dir)
-                    percent = int(((i + 1) / total_files) * 100)
-                    self.progress.emit(percent, f"Extraindo: {member}")
+                image_members = self.collect_image_members(zip_ref)
+            total_files = len(image_members)
+            last_percent = 0
+            last_emit_time = time.monotonic()
+            
+            try:
+                with ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS) as executor:
+                    for i, _ in enumerate(executor.map(self.extract_member_in_worker, image_members)):
+                        percent = int(((i + 1) / total_files) * 100)
+                        now = time.monotonic()
+                        if percent > last_percent or now - last_emit_time >= self.PROGRESS_INTERVAL:
+                            self.progress.emit(percent, f"Extraindo: {image_members[i][0].filename}")
+                            last_percent = percent
+                            last_emit_time = now
+            finally:
+                self.close_worker_zips()
             
             self.progress.emit(100, "Organizando arquivos...")
-            media_files = self.organize_files()
+            media_files = self.organize_files(image_members)
             self.finished.emit(media_files)
             
         except Exception as e:
             self.error.emit(str(e))
-    
-    def organize_files(self):
-        """ Varre o diretório temporário, identifica arquivos de imagem válidos e extrai metadados (ID, data, dedo) baseados na estrutura de pastas e nomes de arquivo. """
-        media_files = []
-        
+
+    def collect_image_members(self, zip_ref):
+        """ Lê apenas o diretório central do ZIP e devolve as entradas de imagem válidas junto com as partes já sanitizadas do caminho. """
+        valid_extensions = self.valid_extensions
+        ext_tuple = self._EXT_TUPLE
+        image_members = []
+        for info in zip_ref.infolist():
+            name = info.filename
+            if not name.endswith(ext_tuple):
+                dot = name.rfind('.')
+                if dot < 0 or name[dot:].lower() not in valid_extensions:
+                    continue
+            if info.is_dir():
+                continue
+            path_parts = self.member_path_parts(name)
+            if not path_parts:
+                continue
+            image_members.append((info, path_parts))
+        return image_members
+
+    @staticmethod
+    def member_path_parts(member_name):
+        """ Divide o nome interno do ZIP (sempre com '/') descartando componentes vazios, '.' ou '..'. """
+        return [part for part in member_name.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+
+    def member_target_path(self, path_parts):
+        """ Monta o caminho de destino dentro do diretório temporário, recusando qualquer caminho que escape dele. """
+        base = os.path.abspath(self.temp_dir)
+        target = os.path.join(base, *path_parts)
+        if os.path.commonpath([base, os.path.abspath(target)]) != base:
+            return None
+        return target
+
+    def worker_zip(self):
+        """ Devolve o handle do ZIP da thread atual, abrindo um novo na primeira chamada (ZipFile não pode ser compartilhado entre threads). """
+        zip_ref = getattr(self._worker_local, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(self.zip_path, 'r')
+            self._worker_local.zip_ref = zip_ref
+            with self._worker_zips_lock:
+                self._worker_zips.append(zip_ref)
+        return zip_ref
+
+    def close_worker_zips(self):
+        """ Fecha os handles do ZIP abertos pelas threads de extração. """
+        with self._worker_zips_lock:
+            for zip_ref in self._worker_zips:
+                zip_ref.close()
+            self._worker_zips.clear()
+        self._worker_local = threading.local()
+
+    def extract_member_in_worker(self, member):
+        """ Tarefa do pool: extrai uma entrada usando o handle do ZIP exclusivo da thread. """
+        info, path_parts = member
+        return self.extract_member(self.worker_zip(), info, path_parts)
+
+    def extract_member(self, zip_ref, info, path_parts):
+        """ Extrai uma única entrada do ZIP por streaming, copiando em blocos grandes direto para o disco. """
+        target = self.member_target_path(path_parts)
+        if target is None:
+            return None
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if info.file_size == 0:
+            open(target, 'wb').close()
+            return target
+        with zip_ref.open(info) as src, open(target, 'wb', buffering=0) as dst:
+            self.copy_with_buffer(src, dst)
+        return target
+
+    def copy_with_buffer(self, src, dst):
+        """ Copia src para dst com readinto em um buffer reaproveitado por thread, sem alocar bytes a cada leitura. """
+        buffer_view = getattr(self._worker_local, 'buffer_view', None)
+        if buffer_view is None:
+            buffer_view = memoryview(bytearray(self.COPY_BUFFER_SIZE))
+            self._worker_local.buffer_view = buffer_view
+        while True:
+            n = src.readinto(buffer_view)
+            if not n:
+                break
+            dst.write(buffer_view[:n])
+
+    def organize_files(self, image_members):
+        """ Monta a lista de mídias a partir das entradas de imagem do ZIP, extraindo metadados (ID, data, dedo) da estrutura de pastas e do nome do arquivo. """
         zip_year_month = self.extract_year_month(os.path.basename(self.zip_path))
         zip_ano, zip_mes = zip_year_month if zip_year_month else ("????", "??")
         
-        all_files = []
+        decorated = []
         
-        for root, _, files in os.walk(self.temp_dir):
-            for file in files:
-                if os.path.splitext(file)[1].lower() not in self.valid_extensions:
-                    continue
-                    
-                file_path = os.path.join(root, file)
-                
-                relative_path = file_path.replace(self.temp_dir, '').strip(os.sep)
-                path_parts = relative_path.split(os.sep)
-                
-                pastas_do_arquivo = path_parts[:-1]
-                ano, mes, idx_ano_mes = self.extract_year_month_from_parts(pastas_do_arquivo)
-                if not ano:
-                    ano, mes = zip_ano, zip_mes
-
-                dia = self.extract_day_from_parts(pastas_do_arquivo, idx_ano_mes)
-                data_formatada = f"{dia}/{mes}/{ano}"
-                if "?" in data_formatada:
-                    data_por_timestamp = self.extract_date_from_filename_timestamp(file)
-                    if data_por_timestamp:
-                        data_formatada = data_por_timestamp
-                id_folder = path_parts[-2] if len(path_parts) >= 2 else "Unknown"
-                
-                nome_sem_ext = os.path.splitext(file)[0]
-                dedo_formatado = self.extract_dedo_info(nome_sem_ext)
-                frame_numero = self.extract_frame_info(nome_sem_ext)
-                
-                all_files.append({
-                    'file_path': file_path,
-                    'filename': file,
-                    'nome_sem_ext': nome_sem_ext,
-                    'data': data_formatada,
-                    'id': id_folder,
-                    'dedo': dedo_formatado,
-                    'frame': frame_numero
-                })
-
-        all_files.sort(key=lambda x: (x['data'], x['id'], x['filename']))
-        return all_files
+        for _, path_parts in image_members:
+            file_path = self.member_target_path(path_parts)
+            if file_path is None:
+                continue
+            file = path_parts[-1]
+            
+            pastas_do_arquivo = path_parts[:-1]
+            ano, mes, idx_ano_mes = self.extract_year_month_from_parts(pastas_do_arquivo)
+            if not ano:
+                ano, mes = zip_ano, zip_mes
+
+            dia = self.extract_day_from_parts(pastas_do_arquivo, idx_ano_mes)
+            data_formatada = f"{dia}/{mes}/{ano}"
+            if "?" in data_formatada:
+                data_por_timestamp = self.extract_date_from_filename_timestamp(file)
+                if data_por_timestamp:
+                    data_formatada = data_por_timestamp
+            id_folder = path_parts[-2] if len(path_parts) >= 2 else "Unknown"
+            
+            nome_sem_ext = file[:file.rfind('.')]
+            dedo_formatado = self.extract_dedo_info(nome_sem_ext)
+            frame_numero = self.extract_frame_info(nome_sem_ext)
+            
+            decorated.append(((data_formatada, id_folder, file), MediaRec(
+                file_path, file, nome_sem_ext,
+                data_formatada, id_folder, dedo_formatado, frame_numero
+            )))
+
+        # A chave de ordenação é montada junto com o registro; o sort só compara as tuplas já prontas.
+        decorated.sort(key=itemgetter(0))
+        return [record for _, record in decorated]
 
     @staticmethod
     def extract_year_month(text):
         """ Extrai ano e mes em formatos como 2024-02, 2024_02, 2024 02 ou 202402. """
-        match = re.search(r'(?<!\d)((?:19|20)\d{2})[ _-]?([01]\d)(?!\d)', text)
-        if not match:
-            return None
-
-        year, month = match.groups()
-        if 1 <= int(month) <= 12:
-            return year, month
-        return None
+        match = ZipLoaderThread._YEAR_MONTH_RE.search(text)
+        return match.groups() if match else None
 
     def extract_year_month_from_parts(self, path_parts):
         """ Procura ano/mes em cada pasta do caminho relativo do arquivo. """
@@ -279,7 +510,7 @@ class ZipLoaderThread(QThread):
     @staticmethod
     def normalize_day(part):
         """ Normaliza dia para dois digitos quando o nome da pasta representa 1..31. """
-        if re.fullmatch(r'\d{1,2}', part):
+        if ZipLoaderThread._DAY_RE.fullmatch(part):
             value = int(part)
             if 1 <= value <= 31:
                 return f"{value:02d}"
@@ -302,7 +533,7 @@ class ZipLoaderThread(QThread):
     @staticmethod
     def extract_date_from_filename_timestamp(filename):
         """ Fallback: converte timestamp Unix no nome do arquivo para dd/mm/YYYY. """
-        match = re.search(r'(?<!\d)(1\d{9}|2\d{9})(?:\.\d+)?(?!\d)', filename)
+        match = ZipLoaderThread._TIMESTAMP_RE.search(filename)
         if not match:
             return None
 
@@ -314,34 +545,305 @@ class ZipLoaderThread(QThread):
     
     def extract_frame_info(self, filename):
         """ Utiliza Expressões Regulares (Regex) para identificar e extrair o número do frame no nome do arquivo. """
-
-        match = re.search(r'_frame_(\d+)', filename, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        return 0
+        match = self._FRAME_RE.search(filename)
+        return int(match.group(1)) if match else 0
     
     def extract_dedo_info(self, filename):
         """ Analisa o nome do arquivo para determinar qual dedo e mão (ex: 'dedao_d') a imagem representa. """
-        parts = filename.lower().split('_')
-        finger_map = {
-            'dedao': 'Dedão', 'indic': 'Indicador', 
-            'medio': 'Médio', 'anel': 'Anelar', 'mind': 'Mindinho'
-        }
-        side_map = {'d': 'Direita', 'e': 'Esquerda'}
+        token_map = self._TOKEN_MAP
         
         found_finger = ""
         found_side = ""
         
-        for part in parts:
-            if part in finger_map: found_finger = finger_map[part]
-            if part in ['d', 'e']: found_side = side_map[part]
-            if len(part) == 2 and part[0].isdigit() and part[1] in ['d', 'e']:
-                found_side = side_map[part[1]]
+        for part in filename.lower().split('_'):
+            info = token_map.get(part)
+            if info:
+                finger, side = info
+                found_finger = finger or found_finger
+                found_side = side or found_side
         
         if found_finger and found_side:
             return f"{found_finger} - {found_side}"
         return found_finger or "Desconhecido"
 
+def qimage_pixels(image):
+    """ Retorna uma view numpy (altura, bytes por linha / 4, 4) gravável sobre os bytes de um QImage de 32 bits, sem copiar. """
+    ptr = image.bits()
+    ptr.setsize(image.sizeInBytes())
+    return np.frombuffer(ptr, dtype=np.uint8).reshape(image.height(), image.bytesPerLine() // 4, 4)
+
+def pixmap_bytes(pixmap):
+    """ Memória aproximada do pixmap em ARGB32, usada para limitar caches de escalas por bytes. """
+    return pixmap.width() * pixmap.height() * 4
+
+def halve_pixmap(pixmap):
+    """ Reduz o pixmap à metade com cv2.INTER_AREA (média de blocos 2x2), bem mais rápido que a escala suave do Qt; formatos fora de 32 bits usam QPixmap.scaled. """
+    image = pixmap.toImage()
+    if image.format() not in (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32, QImage.Format.Format_ARGB32_Premultiplied):
+        return pixmap.scaled(
+            pixmap.width() // 2, pixmap.height() // 2,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    # constBits não força a cópia que bits() faria na imagem compartilhada com o pixmap.
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    width, height = image.width() // 2, image.height() // 2
+    # Recorta para dimensões pares: com fator exatamente 2 o OpenCV usa o caminho rápido de média 2x2.
+    pixels = np.frombuffer(ptr, dtype=np.uint8).reshape(image.height(), image.bytesPerLine() // 4, 4)[:height * 2, :width * 2]
+    reduzida = cv2.resize(pixels, (width, height), interpolation=cv2.INTER_AREA)
+    return QPixmap.fromImage(QImage(reduzida.data, width, height, reduzida.strides[0], image.format()).copy())
+
+def build_filter_luts():
+    """ Tabelas de 256 posições equivalentes às composições do QPainter (Plus, Multiply, Overlay) quando a imagem é opaca. """
+    v = np.arange(256, dtype=np.float64) / 255.0
+    s = 0.6 * v
+    overlay = np.where(v < 0.5, 2.0 * s * v, 0.6 - 2.0 * (1.0 - v) * (0.6 - s)) + 0.4 * v
+    curvas = {
+        'bright': np.minimum(v + 0.3, 1.0),
+        'dark': 0.6 * v,
+        'high_contrast': overlay,
+    }
+    return {nome: np.clip(np.rint(curva * 255.0), 0, 255).astype(np.uint8) for nome, curva in curvas.items()}
+
+# Filtros de cor aplicados por tabela em imagens sem canal alfa; com alfa o QPainter continua fazendo a composição.
+FILTER_LUTS = build_filter_luts()
+
+def rgba_channel_views(img_cv):
+    """ Retorna os canais [A, R, G, B] de uma imagem BGRA do OpenCV como views numpy, sem copiar; a cópia contígua é feita só na camada exibida. """
+    return [img_cv[:, :, 3], img_cv[:, :, 2], img_cv[:, :, 1], img_cv[:, :, 0]]
+
+def rgba_uint8(img_cv):
+    """ Devolve a imagem BGRA do OpenCV em 8 bits por canal: uint8 passa direto, uint16 fica com o byte alto; outros tipos ou formatos devolvem None. """
+    if img_cv is None or img_cv.ndim != 3 or img_cv.shape[2] != 4:
+        return None
+    if img_cv.dtype == np.uint8:
+        return img_cv
+    if img_cv.dtype == np.uint16:
+        return (img_cv >> 8).astype(np.uint8)
+    return None
+
+def load_rgba_sidecar(file_path):
+    """ Abre por memmap o .npy gravado ao lado da imagem extraída na primeira decodificação; devolve None se não existir ou estiver desatualizado. """
+    cache_path = file_path + ".npy"
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(file_path):
+            return None
+        img_cv = np.load(cache_path, mmap_mode='r', allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if img_cv.dtype != np.uint8 or img_cv.ndim != 3 or img_cv.shape[2] != 4:
+        return None
+    return img_cv
+
+def save_rgba_sidecar(file_path, img_cv):
+    """ Grava o .npy em um temporário exclusivo da thread e troca com os.replace: o pool de pré-carga e o ImageLoaderThread podem decodificar a mesma imagem ao mesmo tempo, e quem abre o .npy nunca vê um arquivo pela metade. """
+    cache_path = file_path + ".npy"
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, img_cv, allow_pickle=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # No Windows o destino pode estar mapeado por outra thread; a próxima visita apenas decodifica o PNG de novo.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def decode_image(file_path):
+    """ Lê a imagem com OpenCV para separar os canais RGBA (quando houver 4) e com QImage para exibição. Seguro fora da thread da interface. """
+    img_cv = load_rgba_sidecar(file_path)
+    if img_cv is None:
+        img_cv = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
+        if img_cv is None or img_cv.ndim != 3 or img_cv.shape[2] != 4:
+            return QImage(file_path), None
+        if img_cv.dtype != np.uint8:
+            # PNGs de 16 bits: a exibição fica com o QImage (que entende o formato) e as camadas/filtros recebem a versão 8 bits.
+            img_8 = rgba_uint8(img_cv)
+            return QImage(file_path), rgba_channel_views(img_8) if img_8 is not None else None
+        # Só imagens de 4 canais ganham o .npy; revisitas pulam a decodificação do PNG e leem os canais sob demanda.
+        save_rgba_sidecar(file_path, img_cv)
+
+    canais = rgba_channel_views(img_cv)
+    if sys.byteorder != 'little':
+        return QImage(file_path), canais
+    # BGRA do OpenCV tem a mesma ordem de bytes de Format_ARGB32 em máquinas little-endian; copy() desvincula a QImage do buffer numpy.
+    height, width = img_cv.shape[:2]
+    image = QImage(img_cv.data, width, height, img_cv.strides[0], QImage.Format.Format_ARGB32).copy()
+    return image, canais
+
+class ImagePrefetcher:
+    """ Decodifica em segundo plano as imagens vizinhas da navegação e mantém as mais recentes em um cache LRU limitado. """
+    def __init__(self, max_entries=8, workers=2):
+        """ Cria o pool de decodificação e o cache protegido por lock, pois é preenchido pelas threads do pool. """
+        self.max_entries = max_entries
+        self.workers = workers
+        self._cache = OrderedDict()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def get(self, file_path):
+        """ Retorna (QImage, canais) já decodificados para o caminho, ou None se ainda não estiverem no cache. """
+        with self._lock:
+            entry = self._cache.get(file_path)
+            if entry is not None:
+                self._cache.move_to_end(file_path)
+            return entry
+
+    def store(self, file_path, entry):
+        """ Guarda um resultado decodificado, descartando as entradas menos usadas acima do limite. """
+        with self._lock:
+            self._cache[file_path] = entry
+            self._cache.move_to_end(file_path)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def prefetch(self, file_paths):
+        """ Agenda a decodificação dos caminhos que ainda não estão no cache nem em andamento. """
+        for file_path in file_paths:
+            with self._lock:
+                if file_path in self._cache or file_path in self._pending:
+                    continue
+                self._pending.add(file_path)
+            self._executor.submit(self.load_entry, file_path)
+
+    def load_entry(self, file_path):
+        """ Executado no pool: decodifica o caminho e guarda o resultado se a imagem for válida. """
+        try:
+            entry = decode_image(file_path)
+        except Exception:
+            entry = None
+        with self._lock:
+            self._pending.discard(file_path)
+        if entry is not None and not entry[0].isNull():
+            self.store(file_path, entry)
+
+    def clear(self):
+        """ Espera as decodificações em andamento e esvazia o cache, para que nenhum .npy mapeado da pasta temporária continue aberto. """
+        executor, self._executor = self._executor, ThreadPoolExecutor(max_workers=self.workers)
+        executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._cache.clear()
+            self._pending.clear()
+
+    def shutdown(self):
+        """ Encerra o pool de decodificação, cancelando o que não começou e esperando o que está em andamento. """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._cache.clear()
+            self._pending.clear()
+
+class ImageLoaderThread(QThread):
+    """ Thread que decodifica a imagem atual fora da interface e separa os canais RGBA quando a imagem tiver 4 canais. """
+    loaded = pyqtSignal(int, str, object, object)
+
+    def __init__(self, token, file_path, parent=None):
+        """ Guarda o token da navegação que pediu a imagem; resultados de tokens antigos são descartados pela janela. """
+        super().__init__(parent)
+        self.token = token
+        self.file_path = file_path
+
+    def run(self):
+        """ Decodifica a imagem e entrega o QImage e os canais via sinal. """
+        image, canais = decode_image(self.file_path)
+        self.loaded.emit(self.token, self.file_path, image, canais)
+
+class ImageScaleThread(QThread):
+    """ Thread que refaz a escala suave de um QImage fora da interface; QImage é reentrante e a cópia recebida é só lida. """
+    done = pyqtSignal(int, object)
+
+    def __init__(self, token, image, width, height, parent=None):
+        """ Guarda o token do pedido; a janela descarta resultados de pedidos já substituídos. """
+        super().__init__(parent)
+        self.token = token
+        self.image = image
+        self.width = width
+        self.height = height
+
+    def run(self):
+        """ Escala com filtro suave mantendo a proporção e entrega o QImage resultante via sinal. """
+        scaled = self.image.scaled(
+            self.width, self.height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.done.emit(self.token, scaled)
+
+class ZoomLabel(QLabel):
+    """ QLabel da área de visualização que, em zoom alto, desenha só a região exposta a partir do pixmap de origem em vez de guardar a imagem inteira escalada. """
+    def __init__(self, parent=None):
+        """ Começa no modo comum de QLabel; set_viewport_source ativa o desenho sob demanda. """
+        super().__init__(parent)
+        self._source = None
+        self._smooth = True
+        # Objeto com view_mouse_press/move/release e view_wheel; cada um devolve True quando consumiu o evento.
+        self.input_handler = None
+
+    def set_viewport_source(self, pixmap, width, height, smooth):
+        """ Passa a desenhar pixmap esticado para width x height, recortando em cada paintEvent só o trecho visível. """
+        super().clear()
+        self._source = pixmap
+        self._smooth = smooth
+        self.resize(width, height)
+        self.update()
+
+    def content_key(self):
+        """ Identifica o conteúdo exibido, para que a janela saiba se ainda mostra o último desenho. """
+        if self._source is not None:
+            return ('viewport', self._source.cacheKey(), self._smooth)
+        return self.pixmap().cacheKey()
+
+    def setPixmap(self, pixmap):
+        """ Volta ao modo comum de QLabel com um pixmap já escalado. """
+        self._source = None
+        super().setPixmap(pixmap)
+
+    def setText(self, text):
+        """ Volta ao modo comum de QLabel exibindo texto. """
+        self._source = None
+        super().setText(text)
+
+    def clear(self):
+        """ Descarta o pixmap de origem junto com o conteúdo do QLabel. """
+        self._source = None
+        super().clear()
+
+    def mousePressEvent(self, event):
+        """ Repassa o clique ao input_handler (início do pan); sem tratamento, segue o comportamento do QLabel. """
+        if not (self.input_handler and self.input_handler.view_mouse_press(event)):
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """ Repassa o movimento ao input_handler (arrasto do pan). """
+        if not (self.input_handler and self.input_handler.view_mouse_move(event)):
+            super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """ Repassa a soltura do botão ao input_handler (fim do pan). """
+        if not (self.input_handler and self.input_handler.view_mouse_release(event)):
+            super().mouseReleaseEvent(event)
+
+    def wheelEvent(self, event):
+        """ Repassa a roda ao input_handler (zoom); se ignorada, o QScrollArea rola normalmente. """
+        if not (self.input_handler and self.input_handler.view_wheel(event)):
+            super().wheelEvent(event)
+
+    def paintEvent(self, event):
+        """ No modo sob demanda, escala apenas o retângulo exposto (a rolagem só expõe as faixas novas). """
+        if self._source is None:
+            super().paintEvent(event)
+            return
+        area = event.rect()
+        ratio_x = self._source.width() / max(1, self.width())
+        ratio_y = self._source.height() / max(1, self.height())
+        origem = QRectF(area.x() * ratio_x, area.y() * ratio_y, area.width() * ratio_x, area.height() * ratio_y)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self._smooth)
+        painter.drawPixmap(QRectF(area), self._source, origem)
+        painter.end()
+
 class ProgressDialog(QDialog):
     """ Janela modal simples contendo uma barra de progresso para bloquear a interação durante operações longas. """
     def __init__(self, parent=None):
@@ -363,8 +865,10 @@ class ProgressDialog(QDialog):
 
     def update_progress(self, val, text):
         """ Atualiza o valor da barra e o texto de status; fecha o diálogo automaticamente ao atingir 100%. """
-        self.progress_bar.setValue(val)
-        self.status_label.setText(text)
+        if val != self.progress_bar.value():
+            self.progress_bar.setValue(val)
+        if text != self.status_label.text():
+            self.status_label.setText(text)
         if val >= 100: self.accept()
 
 class AvaliacaoDialog(QDialog):
@@ -376,6 +880,7 @@ class AvaliacaoDialog(QDialog):
         self.parent_window = parent
         self.erros_selecionados = erros_selecionados or []
         self.avaliacoes = {}
+        self._frames_by_index = {}
         for i, erro in enumerate(self.erros_selecionados):
             try:
                 avaliacao = int(erro.get('avaliacao', 0))
@@ -412,17 +917,13 @@ class AvaliacaoDialog(QDialog):
                 QPushButton:pressed { background-color: #3a3a3a; }
                 QScrollArea { border: 1px solid #5a5a5a; border-radius: 5px; background-color: #3a3a3a; }
                 QFrame { background-color: #3a3a3a; border: 1px solid #5a5a5a; border-radius: 5px; margin: 5px; padding: 10px; }
+                QPushButton#estrela { background-color: transparent; border: none; font-size: 36px; padding: 0px; margin: 0px; }
+                QPushButton#estrela[lit="true"] { color: #FFD700; font-weight: bold; }
+                QPushButton#estrela[lit="false"] { color: #0f0f0f; font-weight: normal; }
+                QPushButton#estrela:hover { color: #FFD700; background-color: rgba(255, 215, 0, 0.2); border-radius: 30px; }
             """,
             'frame': """
                 QFrame { background-color: #4a4a4a; border: 2px solid #6a6a6a; border-radius: 8px; margin: 5px; padding: 15px; }
-            """,
-            'estrela_acesa': """
-                QPushButton { background-color: transparent; border: none; color: #FFD700; font-size: 36px; font-weight: bold; padding: 0px; margin: 0px; }
-                QPushButton:hover { color: #FFD700; background-color: rgba(255, 215, 0, 0.2); border-radius: 30px; }
-            """,
-            'estrela_apagada': """
-                QPushButton { background-color: transparent; border: none; color: #0f0f0f; font-size: 36px; font-weight: normal; padding: 0px; margin: 0px; }
-                QPushButton:hover { color: #FFD700; background-color: rgba(255, 215, 0, 0.2); border-radius: 30px; }
             """
         }
 
@@ -430,6 +931,10 @@ class AvaliacaoDialog(QDialog):
         """ Constrói a interface dinâmica baseada na quantidade de erros selecionados, escolhendo entre renderização total ou progressiva. """
         self.blockSignals(True)
         
+        self._frames_by_index.clear()
+        self.scroll_area = None
+        self.scroll_widget = None
+        self.scroll_layout = None
         while self.main_layout.count():
             child = self.main_layout.takeAt(0)
             if child.widget():
@@ -460,43 +965,60 @@ class AvaliacaoDialog(QDialog):
     def create_all_erros_at_once(self):
         """ Cria todos os widgets de erro de uma vez; usado quando há poucos erros para exibir. """
         self.create_scroll_area()
-        for i, erro in enumerate(self.erros_selecionados):
-            erro_frame = self.create_erro_frame_optimized(i, erro)
-            self.scroll_layout.addWidget(erro_frame)
-            self.atualizar_estrelas_display(i)
-            self.atualizar_label_avaliacao(i)
-        QApplication.processEvents()
+        self.begin_batch_insert()
+        try:
+            for i, erro in enumerate(self.erros_selecionados):
+                erro_frame = self.create_erro_frame_optimized(i, erro)
+                self.scroll_layout.addWidget(erro_frame)
+                self.atualizar_estrelas_display(i)
+                self.atualizar_label_avaliacao(i)
+        finally:
+            self.end_batch_insert()
 
     def create_scroll_area(self):
         """ Configura a área de rolagem onde os itens de avaliação serão inseridos. """
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
+        self.scroll_area = QScrollArea()
+        self.scroll_widget = QWidget()
         self.scroll_layout = QVBoxLayout()
-        scroll_widget.setLayout(self.scroll_layout)
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        self.main_layout.addWidget(scroll_area)
+        self.scroll_widget.setLayout(self.scroll_layout)
+        self.scroll_area.setWidget(self.scroll_widget)
+        self.scroll_area.setWidgetResizable(True)
+        self.main_layout.addWidget(self.scroll_area)
+
+    def begin_batch_insert(self):
+        """ Suspende pintura e recálculo de layout da área de rolagem enquanto um lote de frames é inserido. """
+        self.scroll_widget.setUpdatesEnabled(False)
+        self.scroll_layout.setEnabled(False)
+
+    def end_batch_insert(self):
+        """ Reativa o layout e a pintura, aplicando de uma vez o recálculo acumulado pelo lote. """
+        self.scroll_layout.setEnabled(True)
+        self.scroll_layout.activate()
+        self.scroll_widget.setUpdatesEnabled(True)
 
     def create_erros_progressively_fast(self):
         """ Cria os widgets de erro em lotes usando QTimer para manter a interface responsiva se houver muitos itens. """
         if not hasattr(self, 'erro_index_atual'):
             self.erro_index_atual = 0
         
-        erros_por_lote = min(20, len(self.erros_selecionados) - self.erro_index_atual)
-        
-        for _ in range(erros_por_lote):
-            if self.erro_index_atual < len(self.erros_selecionados):
-                erro = self.erros_selecionados[self.erro_index_atual]
-                erro_frame = self.create_erro_frame_optimized(self.erro_index_atual, erro)
-                self.scroll_layout.addWidget(erro_frame)
-                self.atualizar_estrelas_display(self.erro_index_atual)
-                self.atualizar_label_avaliacao(self.erro_index_atual)
-                self.erro_index_atual += 1
+        erros_por_lote = min(50, len(self.erros_selecionados) - self.erro_index_atual)
         
+        self.begin_batch_insert()
+        try:
+            for _ in range(erros_por_lote):
+                if self.erro_index_atual < len(self.erros_selecionados):
+                    erro = self.erros_selecionados[self.erro_index_atual]
+                    erro_frame = self.create_erro_frame_optimized(self.erro_index_atual, erro)
+                    self.scroll_layout.addWidget(erro_frame)
+                    self.atualizar_estrelas_display(self.erro_index_atual)
+                    self.atualizar_label_avaliacao(self.erro_index_atual)
+                    self.erro_index_atual += 1
+        finally:
+            self.end_batch_insert()
+        
+        self.scroll_area.viewport().update()
         if self.erro_index_atual < len(self.erros_selecionados):
             QTimer.singleShot(1, self.create_erros_progressively_fast)
-        else:
-            QApplication.processEvents()
 
     def create_erro_frame_optimized(self, index, erro):
         """ Fabrica o widget visual (Frame) de um único erro, contendo título, descrição e o sistema de estrelas. """
@@ -520,12 +1042,15 @@ class AvaliacaoDialog(QDialog):
         estrelas = []
         for i in range(5):
             estrela = QPushButton("☆") 
+            estrela.setObjectName("estrela")
             estrela.setFixedSize(60, 60)
-            estrela.setStyleSheet(self.cached_styles['estrela_apagada'])
+            estrela.setProperty("lit", False)
+            estrela.acesa = False
             
-            estrela.enterEvent = self.create_hover_handler(index, i)
-            estrela.leaveEvent = self.create_leave_handler(index)
-            estrela.clicked.connect(self.create_click_handler(index, i))
+            estrela.setProperty("ei", index)
+            estrela.setProperty("si", i)
+            estrela.installEventFilter(self)
+            estrela.clicked.connect(self.on_estrela_clicked)
             
             stars_layout.addWidget(estrela)
             estrelas.append(estrela)
@@ -541,19 +1066,22 @@ class AvaliacaoDialog(QDialog):
         layout.addWidget(avaliacao_label)
         
         frame.setLayout(layout)
+        self._frames_by_index[index] = frame
         return frame
 
-    def create_hover_handler(self, erro_index, estrela_index):
-        """ Factory method para criar eventos de hover (passar o mouse) personalizados para as estrelas. """
-        return lambda event: self.on_estrela_hover(erro_index, estrela_index)
-
-    def create_leave_handler(self, erro_index):
-        """ Factory method para restaurar o estado visual das estrelas quando o mouse sai do componente. """
-        return lambda event: self.on_mouse_leave_estrelas(erro_index)
+    def eventFilter(self, source, event):
+        """ Filtro único instalado em todas as estrelas: encaminha entrada e saída do mouse usando os índices guardados como propriedades. """
+        event_type = event.type()
+        if event_type == QEvent.Type.Enter:
+            self.on_estrela_hover(source.property("ei"), source.property("si"))
+        elif event_type == QEvent.Type.Leave:
+            self.on_mouse_leave_estrelas(source.property("ei"))
+        return super().eventFilter(source, event)
 
-    def create_click_handler(self, erro_index, estrela_index):
-        """ Factory method para registrar a nota clicada pelo usuário. """
-        return lambda: self.on_estrela_click(erro_index, estrela_index)
+    def on_estrela_clicked(self):
+        """ Slot compartilhado pelos cliques das estrelas; identifica o erro e a nota pelas propriedades do botão emissor. """
+        estrela = self.sender()
+        self.on_estrela_click(estrela.property("ei"), estrela.property("si"))
 
     def create_buttons(self):
         """ Adiciona os botões de confirmação e cancelamento ao layout principal. """
@@ -568,22 +1096,11 @@ class AvaliacaoDialog(QDialog):
         buttons_layout.addWidget(btn_ok)
         self.main_layout.addLayout(buttons_layout)
 
-    def get_estrela_style(self, acesa=False):
-        """ Retorna o estilo CSS apropriado para uma estrela acesa ou apagada. """
-        return self.cached_styles['estrela_acesa'] if acesa else self.cached_styles['estrela_apagada']
-    
     def on_estrela_hover(self, erro_index, estrela_index):
         """ Atualiza visualmente as estrelas em tempo real enquanto o usuário move o mouse. """
         frame = self.find_frame_by_index(erro_index)
         if frame:
-            estrelas = frame.estrelas
-            for i in range(5):
-                if i <= estrela_index:
-                    estrelas[i].setText("★")
-                    estrelas[i].setStyleSheet(self.get_estrela_style(True))
-                else:
-                    estrelas[i].setText("☆")
-                    estrelas[i].setStyleSheet(self.get_estrela_style(False))
+            self.aplicar_estado_estrelas(frame, estrela_index + 1)
     
     def on_mouse_leave_estrelas(self, erro_index):
         """ Reseta a visualização das estrelas para refletir a nota salva (ou nenhuma) ao tirar o mouse. """
@@ -599,15 +1116,19 @@ class AvaliacaoDialog(QDialog):
         """ Renderiza o estado atual das estrelas de um erro específico. """
         frame = self.find_frame_by_index(erro_index)
         if frame:
-            estrelas = frame.estrelas
-            avaliacao = self.avaliacoes.get(erro_index, 0)
-            for i in range(5):
-                if i < avaliacao:
-                    estrelas[i].setText("★")
-                    estrelas[i].setStyleSheet(self.get_estrela_style(True))
-                else:
-                    estrelas[i].setText("☆")
-                    estrelas[i].setStyleSheet(self.get_estrela_style(False))
+            self.aplicar_estado_estrelas(frame, self.avaliacoes.get(erro_index, 0))
+
+    def aplicar_estado_estrelas(self, frame, quantidade_acesas):
+        """ Acende as primeiras estrelas do frame, alterando texto e estilo apenas dos botões cujo estado realmente mudou. """
+        for i, estrela in enumerate(frame.estrelas):
+            acesa = i < quantidade_acesas
+            if estrela.acesa != acesa:
+                estrela.acesa = acesa
+                estrela.setText("★" if acesa else "☆")
+                estrela.setProperty("lit", acesa)
+                style = estrela.style()
+                style.unpolish(estrela)
+                style.polish(estrela)
     
     def atualizar_label_avaliacao(self, erro_index):
         """ Atualiza o texto descritivo (ex: '3/5') abaixo das estrelas. """
@@ -621,14 +1142,8 @@ class AvaliacaoDialog(QDialog):
                 frame.avaliacao_label.setText("Avaliação: Não avaliado")
     
     def find_frame_by_index(self, erro_index):
-        """ Busca na árvore de widgets o frame correspondente ao índice do erro para atualizações visuais. """
-        scroll_area = self.findChild(QScrollArea)
-        if scroll_area:
-            scroll_widget = scroll_area.widget()
-            for child in scroll_widget.findChildren(QFrame):
-                if hasattr(child, 'erro_index') and child.erro_index == erro_index:
-                    return child
-        return None
+        """ Retorna o frame correspondente ao índice do erro, registrado no momento da sua criação. """
+        return self._frames_by_index.get(erro_index)
     
     def center_on_screen(self):
         """ Calcula a geometria da tela e centraliza o diálogo. """
@@ -654,24 +1169,81 @@ class AvaliacaoDialog(QDialog):
 
     def accept(self):
         """ Salva a posição e aceita o diálogo. """
-        SETTINGS.setValue("AvaliacaoDialog/pos", self.pos())
+        save_dialog_position(self, "AvaliacaoDialog/pos")
         super().accept()
 
     def reject(self):
         """ Salva a posição e rejeita o diálogo. """
-        SETTINGS.setValue("AvaliacaoDialog/pos", self.pos())
+        save_dialog_position(self, "AvaliacaoDialog/pos")
         super().reject()
 
     def closeEvent(self, event):
         """ Salva a posição da janela antes de fechar. """
-        SETTINGS.setValue("AvaliacaoDialog/pos", self.pos())
+        save_dialog_position(self, "AvaliacaoDialog/pos")
         super().closeEvent(event)
 
     def hideEvent(self, event):
         """ Salva a posição quando a janela é ocultada. """
-        SETTINGS.setValue("AvaliacaoDialog/pos", self.pos())
+        save_dialog_position(self, "AvaliacaoDialog/pos")
         super().hideEvent(event)
 
+class DescricoesListModel(QAbstractListModel):
+    """ Modelo de lista para descrições de erro: guarda linhas (rótulo, nome, descrição) já montadas e entrega texto, tooltip e dados direto delas. """
+    def __init__(self, com_nome=True, parent=None):
+        """ com_nome=True exibe '[nome] descrição...' com tooltip e devolve (nome, descrição); False exibe só a descrição e devolve o texto completo. """
+        super().__init__(parent)
+        self.com_nome = com_nome
+        self._rows = []
+
+    @staticmethod
+    def build_rows(nome, descricoes, com_nome=True):
+        """ Monta as linhas (rótulo, nome, descrição) de um nome de erro, com o rótulo já recortado para exibição. """
+        if com_nome:
+            return [(f"[{nome}] {desc[:50]}...", nome, desc) for desc in descricoes]
+        return [(desc[:50] + "..." if len(desc) > 50 else desc, nome, desc) for desc in descricoes]
+
+    def set_rows(self, rows):
+        """ Substitui todas as linhas de uma vez com um único reset do modelo. """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """ Acrescenta linhas ao final sem resetar o modelo; a view só cria o que for visível. """
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """ Remove uma única linha sem resetar o modelo. """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        label, nome, desc = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return label
+        if role == Qt.ItemDataRole.UserRole:
+            return (nome, desc) if self.com_nome else desc
+        if role == Qt.ItemDataRole.ToolTipRole and self.com_nome:
+            return desc
+        return None
+
+    def row_data(self, row):
+        """ Retorna o mesmo valor de UserRole da linha, sem passar por QModelIndex. """
+        _, nome, desc = self._rows[row]
+        return (nome, desc) if self.com_nome else desc
+
+
 class ErroDialog(QDialog):
     """ Diálogo não modal para seleção de erros do catálogo personalizado com validação de correspondência entre nomes e descrições. """
     def __init__(self, parent=None, custom_errors=None):
@@ -682,6 +1254,15 @@ class ErroDialog(QDialog):
         self.custom_errors = custom_errors or {}
         self.selected_names = []
         self.selected_descriptions = []
+        # Linhas prontas por nome e por combinação de nomes; o catálogo não muda enquanto o diálogo existe.
+        self._desc_index = {
+            nome: DescricoesListModel.build_rows(nome, descricoes)
+            for nome, descricoes in self.custom_errors.get("descricoes", {}).items()
+        }
+        self._desc_cache = {}
+        self._desc_key = None
+        # Dados das descrições selecionadas, atualizados a cada mudança de seleção em vez de varrer a lista em cada consulta.
+        self._selected_desc_data = []
 
         # Janela não-modal para permitir interação com a imagem
         self.setModal(False)
@@ -701,11 +1282,11 @@ class ErroDialog(QDialog):
             QPushButton { background-color: #4a4a4a; border: 1px solid #6a6a6a; border-radius: 5px; padding: 8px 15px; color: white; font-size: 12px; min-width: 80px; }
             QPushButton:hover { background-color: #5a5a5a; }
             QPushButton:pressed { background-color: #3a3a3a; }
-            QListWidget { background-color: #3a3a3a; border: 1px solid #5a5a5a; border-radius: 5px; color: white; font-size: 12px; }
-            QListWidget::item { padding: 8px; border-bottom: 1px solid #4a4a4a; background-color: transparent; }
-            QListWidget::item:selected { background-color: #0080FF; color: white; }
-            QListWidget::item:hover { background-color: #4a4a4a; }
-            QListWidget::item:selected:hover { background-color: #3399FF; color: white; }
+            QListView { background-color: #3a3a3a; border: 1px solid #5a5a5a; border-radius: 5px; color: white; font-size: 12px; }
+            QListView::item { padding: 8px; border-bottom: 1px solid #4a4a4a; background-color: transparent; }
+            QListView::item:selected { background-color: #0080FF; color: white; }
+            QListView::item:hover { background-color: #4a4a4a; }
+            QListView::item:selected:hover { background-color: #3399FF; color: white; }
             QTabWidget::pane { border: 1px solid #5a5a5a; background-color: #2b2b2b; }
             QTabBar::tab { background-color: #4a4a4a; color: white; padding: 8px 15px; margin-right: 2px; border-top-left-radius: 5px; border-top-right-radius: 5px; }
             QTabBar::tab:selected { background-color: #0080FF; }
@@ -749,9 +1330,11 @@ class ErroDialog(QDialog):
         self.instrucao_desc.setStyleSheet("font-size: 11px; color: #cccccc; margin-bottom: 10px;")
         l_desc.addWidget(self.instrucao_desc)
         
-        self.list_descriptions = QListWidget()
-        self.list_descriptions.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.list_descriptions.itemSelectionChanged.connect(self.on_descriptions_selection_changed)
+        self.list_descriptions = QListView()
+        self.desc_model = DescricoesListModel(com_nome=True, parent=self)
+        self.list_descriptions.setModel(self.desc_model)
+        self.list_descriptions.setSelectionMode(QListView.SelectionMode.MultiSelection)
+        self.list_descriptions.selectionModel().selectionChanged.connect(self.on_descriptions_selection_changed)
         l_desc.addWidget(self.list_descriptions)
         
         self.label_count_desc = QLabel("Nenhuma descrição disponível")
@@ -779,7 +1362,7 @@ class ErroDialog(QDialog):
 
     def on_tab_changed(self, index):
         """ Atualiza a lista de descrições quando o usuário muda para a aba de descrições. """
-        if index == 1: self.update_descriptions()
+        if index == 1 and self._desc_key != self.selected_names_key(): self.update_descriptions()
 
     def on_names_selection_changed(self):
         count = len(self.list_names.selectedItems())
@@ -788,32 +1371,63 @@ class ErroDialog(QDialog):
 
     def on_descriptions_selection_changed(self):
         """ Atualiza o contador de descrições selecionadas para feedback visual ao usuário. """
-        count = len(self.list_descriptions.selectedItems())
+        self.refresh_selected_descriptions()
+        count = len(self._selected_desc_data)
         self.label_count_desc.setText(f"{count} descrição(ões) selecionada(s)")
 
     def update_descriptions(self):
         """ Filtra e exibe apenas as descrições correspondentes aos nomes de erro selecionados. """
-        current_selected = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_descriptions.selectedItems()]
-        self.list_descriptions.clear()
+        current_selected = set(self._selected_desc_data)
         
-        selected_names = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_names.selectedItems()]
+        selected_names = self.selected_names_key()
+        self._desc_key = selected_names
         if not selected_names:
+            self.desc_model.set_rows([])
+            self._selected_desc_data = []
             self.instrucao_desc.setText("Selecione nomes na aba anterior...")
             return
 
         self.instrucao_desc.setText(f"Descrições para: {', '.join(selected_names[:3])}...")
-        desc_obj = self.custom_errors.get("descricoes", {})
-        
-        for nome in selected_names:
-            for desc in desc_obj.get(nome, []):
-                item_text = f"[{nome}] {desc[:50]}..."
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, (nome, desc))
-                item.setToolTip(desc)
-                self.list_descriptions.addItem(item)
-                if (nome, desc) in current_selected: item.setSelected(True)
+        
+        rows = self._desc_cache.get(selected_names)
+        if rows is None:
+            desc_index = self._desc_index
+            rows = [row for nome in selected_names for row in desc_index.get(nome, ())]
+            self._desc_cache[selected_names] = rows
+        
+        self.desc_model.set_rows(rows)
+        self.select_descriptions(current_selected)
+        # O reset do modelo limpa a seleção sem emitir selectionChanged.
+        self.refresh_selected_descriptions()
                 
-        self.label_count_desc.setText(f"{self.list_descriptions.count()} disponíveis")
+        self.label_count_desc.setText(f"{self.desc_model.rowCount()} disponíveis")
+
+    def refresh_selected_descriptions(self):
+        """ Recalcula os pares (nome, descrição) selecionados, na ordem das linhas, a partir do modelo de seleção. """
+        rows = sorted(index.row() for index in self.list_descriptions.selectionModel().selectedRows())
+        row_data = self.desc_model.row_data
+        self._selected_desc_data = [row_data(row) for row in rows]
+
+    def selected_descriptions_data(self):
+        """ Retorna uma cópia dos pares (nome, descrição) selecionados na lista de descrições. """
+        return list(self._selected_desc_data)
+
+    def select_descriptions(self, desejados):
+        """ Seleciona, com uma única operação no modelo de seleção, as linhas cujos dados estão em 'desejados'. """
+        if not desejados:
+            return
+        selection = QItemSelection()
+        model = self.desc_model
+        for row in range(model.rowCount()):
+            if model.row_data(row) in desejados:
+                index = model.index(row)
+                selection.select(index, index)
+        if not selection.isEmpty():
+            self.list_descriptions.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+
+    def selected_names_key(self):
+        """ Retorna os nomes selecionados como tupla, usada como chave do cache de descrições. """
+        return tuple(item.data(Qt.ItemDataRole.UserRole) for item in self.list_names.selectedItems())
 
     def clear_all_selections(self):
         """ Remove todas as seleções de nomes e descrições, resetando o formulário. """
@@ -826,36 +1440,36 @@ class ErroDialog(QDialog):
 
     def get_selections(self):
         """ Retorna uma tupla contendo listas vazias de nomes e tuplas (nome, descrição) das descrições selecionadas. """
-        return ([], [item.data(Qt.ItemDataRole.UserRole) for item in self.list_descriptions.selectedItems()])
+        return ([], self.selected_descriptions_data())
 
     def accept(self):
         """ Salva a posição e a seleção atual antes de aceitar o diálogo. """
-        SETTINGS.setValue("ErroDialog/pos", self.pos())
+        save_dialog_position(self, "ErroDialog/pos")
         self.salvar_selecao_atual()
         super().accept()
 
     def reject(self):
         """ Salva a posição e a seleção atual antes de rejeitar o diálogo. """
-        SETTINGS.setValue("ErroDialog/pos", self.pos())
+        save_dialog_position(self, "ErroDialog/pos")
         self.salvar_selecao_atual()
         super().reject()
 
     def closeEvent(self, event):
         """ Salva a posição da janela nas configurações antes de fechar. """
-        SETTINGS.setValue("ErroDialog/pos", self.pos())
+        save_dialog_position(self, "ErroDialog/pos")
         self.salvar_selecao_atual()
         super().closeEvent(event)
 
     def hideEvent(self, event):
         """ Salva a posição quando a janela é ocultada. """
-        SETTINGS.setValue("ErroDialog/pos", self.pos())
+        save_dialog_position(self, "ErroDialog/pos")
         self.salvar_selecao_atual()
         super().hideEvent(event)
 
     def salvar_selecao_atual(self):
         """ Salva os nomes e descrições selecionados atualmente. """
         nomes_selecionados = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_names.selectedItems()]
-        descricoes_selecionadas = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_descriptions.selectedItems()]
+        descricoes_selecionadas = self.selected_descriptions_data()
 
         SETTINGS.setValue("ErroDialog/selected_names", nomes_selecionados)
         SETTINGS.setValue("ErroDialog/selected_descriptions", descricoes_selecionadas)
@@ -877,11 +1491,7 @@ class ErroDialog(QDialog):
         self.update_descriptions()
 
         if isinstance(descricoes_salvas, list):
-            for i in range(self.list_descriptions.count()):
-                item = self.list_descriptions.item(i)
-                desc_data = item.data(Qt.ItemDataRole.UserRole)
-                if desc_data in descricoes_salvas:
-                    item.setSelected(True)
+            self.select_descriptions({tuple(d) for d in descricoes_salvas if isinstance(d, (list, tuple))})
     
     def validate_and_accept(self):
         """ Valida se cada nome selecionado possui ao menos uma descrição correspondente selecionada. """
@@ -891,14 +1501,12 @@ class ErroDialog(QDialog):
             self.reject()
             return
 
-        descricoes_data = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_descriptions.selectedItems()]
+        descricoes_data = self.selected_descriptions_data()
         
         nomes_com_descricao = {dado[0] for dado in descricoes_data}
         
-        pendentes = []
-        for nome in nomes_selecionados:
-            if nome not in nomes_com_descricao:
-                pendentes.append(nome)
+        faltando = set(nomes_selecionados) - nomes_com_descricao
+        pendentes = [nome for nome in nomes_selecionados if nome in faltando] if faltando else []
         
         if pendentes:
             msg = "Você selecionou os seguintes erros mas não escolheu a descrição:\n\n"
@@ -923,6 +1531,7 @@ class CustomErrorsDialog(QDialog):
         self.parent_window = parent
         self.errors_file = find_catalog_file("catalogo_erros.json")
         self.custom_errors = self.load_custom_errors()
+        self.build_lookup_sets()
         
         self.init_ui()
         self.load_existing_errors()
@@ -978,23 +1587,23 @@ class CustomErrorsDialog(QDialog):
             QPushButton#delete_btn:hover {
                 background-color: #A52A2A;
             }
-            QListWidget {
+            QListView {
                 background-color: #3a3a3a;
                 border: 1px solid #5a5a5a;
                 border-radius: 5px;
                 color: white;
                 font-size: 12px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #4a4a4a;
                 background-color: transparent;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0080FF;
                 color: white;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #4a4a4a;
             }
             QTabWidget::pane {
@@ -1093,6 +1702,9 @@ class CustomErrorsDialog(QDialog):
         nome_layout = QHBoxLayout()
         nome_layout.addWidget(QLabel("Nome:"))
         self.combo_nome_desc = QComboBox()
+        # Só troca de nome pela roda depois de receber foco; rolar por cima do diálogo não reconstrói a lista de descrições.
+        self.combo_nome_desc.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.combo_nome_desc.installEventFilter(self)
         self.combo_nome_desc.currentTextChanged.connect(self.on_nome_desc_changed)
         nome_layout.addWidget(self.combo_nome_desc)
         layout.addLayout(nome_layout)  
@@ -1109,7 +1721,9 @@ class CustomErrorsDialog(QDialog):
         add_desc_btn.clicked.connect(self.add_descricao)
         layout.addWidget(add_desc_btn)
         
-        self.descricao_list = QListWidget()
+        self.descricao_list = QListView()
+        self.descricao_model = DescricoesListModel(com_nome=False, parent=self)
+        self.descricao_list.setModel(self.descricao_model)
         layout.addWidget(self.descricao_list)
         
         delete_desc_btn = QPushButton("Excluir Selecionado")
@@ -1122,19 +1736,26 @@ class CustomErrorsDialog(QDialog):
 
     def load_custom_errors(self):
         """ Carrega o arquivo catalogo_erros.json ou retorna estrutura vazia se não existir. """
-        if os.path.exists(self.errors_file):
-            try:
-                with open(self.errors_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        data = load_catalog(self.errors_file)
+        if data is not None:
+            return data
         return {"nomes": [], "descricoes": {}}
     
+    def build_lookup_sets(self):
+        """ Monta conjuntos auxiliares de nomes e descrições para checar duplicatas em O(1); as listas continuam sendo a forma salva no JSON. """
+        self._nomes_set = set(self.custom_errors.get("nomes", []))
+        self._desc_sets = {
+            nome: set(descricoes)
+            for nome, descricoes in self.custom_errors.get("descricoes", {}).items()
+        }
+        # Linhas de exibição por nome, montadas sob demanda e descartadas quando as descrições do nome mudam.
+        self._desc_index = {}
+
     def save_custom_errors(self):
         """ Grava a estrutura de erros personalizada no arquivo catalogo_erros.json em formato JSON. """
         try:
-            with open(self.errors_file, 'w', encoding='utf-8') as f:
-                json.dump(self.custom_errors, f, ensure_ascii=False, indent=2)
+            write_bytes_atomic(self.errors_file, dump_catalog_bytes(self.custom_errors))
+            remember_catalog(self.errors_file, self.custom_errors)
             return True
         except Exception as e:
             print(f"Erro ao salvar: {e}")
@@ -1154,35 +1775,42 @@ class CustomErrorsDialog(QDialog):
     
     def update_nome_combo_desc(self):
         """ Atualiza a lista de opções do combobox com os nomes de erro disponíveis no catálogo. """
+        self.combo_nome_desc.blockSignals(True)
         self.combo_nome_desc.clear()
-        self.combo_nome_desc.addItem("Selecione um nome...")
-        nomes = self.custom_errors.get("nomes", [])
-        for nome in nomes:
-            self.combo_nome_desc.addItem(nome)
+        self.combo_nome_desc.addItems(["Selecione um nome...", *self.custom_errors.get("nomes", [])])
+        self.combo_nome_desc.blockSignals(False)
+        self.update_descricoes_list()
     
+    def eventFilter(self, source, event):
+        """ Descarta eventos de roda sobre o combo de nomes enquanto ele não tem foco. """
+        if source is self.combo_nome_desc and event.type() == QEvent.Type.Wheel and not source.hasFocus():
+            return True
+        return super().eventFilter(source, event)
+
     def update_descricoes_list(self):
         """ Carrega e exibe as descrições associadas ao nome de erro selecionado no combo. """
-        self.descricao_list.clear()
         nome_text = self.combo_nome_desc.currentText()
         if nome_text == "Selecione um nome..." or not nome_text:
+            self.descricao_model.set_rows([])
             return
         
-        descricoes = self.custom_errors.get("descricoes", {}).get(nome_text, [])
-        for descricao in descricoes:
-            display_text = descricao[:50] + "..." if len(descricao) > 50 else descricao
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, descricao)
-            self.descricao_list.addItem(item)
+        rows = self._desc_index.get(nome_text)
+        if rows is None:
+            descricoes = self.custom_errors.get("descricoes", {}).get(nome_text, [])
+            rows = DescricoesListModel.build_rows(nome_text, descricoes, com_nome=False)
+            self._desc_index[nome_text] = rows
+        self.descricao_model.set_rows(rows)
 
     def add_nome(self):
         """ Adiciona um novo nome de erro ao catálogo se não for duplicado. """
         texto = self.nome_input.text().strip()
         if not texto: return
         
-        nomes = self.custom_errors.setdefault("nomes", [])
-        if texto not in nomes:
-            nomes.append(texto)
+        if texto not in self._nomes_set:
+            self.custom_errors.setdefault("nomes", []).append(texto)
+            self._nomes_set.add(texto)
             self.custom_errors.setdefault("descricoes", {})[texto] = []
+            self._desc_sets[texto] = set()
             self.nome_list.addItem(texto)
             self.update_nome_combo_desc()
             self.nome_input.clear()
@@ -1195,10 +1823,15 @@ class CustomErrorsDialog(QDialog):
         texto = self.descricao_input.toPlainText().strip()
         if not texto: return
         
-        descricoes = self.custom_errors.setdefault("descricoes", {}).setdefault(nome_text, [])
-        if texto not in descricoes:
-            descricoes.append(texto)
-            self.update_descricoes_list()
+        descricoes_set = self._desc_sets.setdefault(nome_text, set())
+        if texto not in descricoes_set:
+            self.custom_errors.setdefault("descricoes", {}).setdefault(nome_text, []).append(texto)
+            descricoes_set.add(texto)
+            novas = DescricoesListModel.build_rows(nome_text, [texto], com_nome=False)
+            rows = self._desc_index.get(nome_text)
+            if rows is not None:
+                rows.extend(novas)
+            self.descricao_model.append_rows(novas)
             self.descricao_input.clear()
 
     def delete_nome(self):
@@ -1212,29 +1845,39 @@ class CustomErrorsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             nomes = self.custom_errors.get("nomes", [])
-            if nome in nomes: nomes.remove(nome)
+            if nome in self._nomes_set:
+                nomes.remove(nome)
+                self._nomes_set.discard(nome)
             descricoes = self.custom_errors.get("descricoes", {})
             if nome in descricoes: del descricoes[nome]
+            self._desc_sets.pop(nome, None)
+            self._desc_index.pop(nome, None)
             
             self.nome_list.takeItem(self.nome_list.row(current_item))
             self.update_nome_combo_desc()
-            self.update_descricoes_list()
 
     def delete_descricao(self):
         """ Remove uma descrição específica do nome de erro selecionado após confirmação. """
         nome_text = self.combo_nome_desc.currentText()
-        current_item = self.descricao_list.currentItem()
-        if not current_item or not nome_text or nome_text == "Selecione um nome...": return
+        current_index = self.descricao_list.currentIndex()
+        if not current_index.isValid() or not nome_text or nome_text == "Selecione um nome...": return
         
-        descricao_completa = current_item.data(Qt.ItemDataRole.UserRole)
+        descricao_completa = current_index.data(Qt.ItemDataRole.UserRole)
         reply = QMessageBox.question(self, 'Confirmar', "Excluir esta descrição?", 
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
             descricoes = self.custom_errors.get("descricoes", {}).get(nome_text, [])
-            if descricao_completa in descricoes:
-                descricoes.remove(descricao_completa)
-            self.update_descricoes_list()
+            row = current_index.row()
+            if row < len(descricoes) and descricoes[row] == descricao_completa:
+                del descricoes[row]
+                # Arquivos editados à mão podem repetir a descrição; ela só sai do conjunto quando some da lista.
+                if descricao_completa not in descricoes:
+                    self._desc_sets.get(nome_text, set()).discard(descricao_completa)
+                rows = self._desc_index.get(nome_text)
+                if rows is not None:
+                    del rows[row]
+                self.descricao_model.remove_row(row)
 
     def save_all_changes(self):
         """ Salva todas as alterações no arquivo JSON e fecha o diálogo se bem-sucedido. """
@@ -1246,12 +1889,12 @@ class CustomErrorsDialog(QDialog):
 
     def closeEvent(self, event):
         """ Salva a posição da janela antes de fechar. """
-        SETTINGS.setValue("CustomErrorsDialog/pos", self.pos())
+        save_dialog_position(self, "CustomErrorsDialog/pos")
         super().closeEvent(event)
 
     def hideEvent(self, event):
         """ Salva a posição quando a janela é ocultada. """
-        SETTINGS.setValue("CustomErrorsDialog/pos", self.pos())
+        save_dialog_position(self, "CustomErrorsDialog/pos")
         super().hideEvent(event)
 
 class ClickableLabel(QLabel):
@@ -1364,6 +2007,48 @@ class ManualDialog(QDialog):
 
 class MainWindow(QMainWindow):
     """ Janela principal do aplicativo Benapro para análise e avaliação de imagens biométricas de impressões digitais. """
+    _STYLE_CACHE = {}
+    _ICON_CACHE = {}
+    # Limite em bytes (ARGB32) das escalas guardadas em _zoom_cache; uma só entrada perto de VIEWPORT_RENDER_PIXELS já ocupa ~64 MB.
+    ZOOM_CACHE_BYTES = 128 * 1024 * 1024
+    # Acima desta área (em pixels) a imagem ampliada não é mais escalada inteira: ZoomLabel desenha só a parte visível.
+    VIEWPORT_RENDER_PIXELS = 4096 * 4096
+    # O zoom anda numa escada geométrica ZOOM_BASE ** passo, em degraus de 1/ZOOM_STEP_FRACTION de "clique"; ir e voltar cai sempre no mesmo fator (e no mesmo cache).
+    ZOOM_BASE = 1.10
+    ZOOM_STEP_FRACTION = 8
+    ZOOM_MIN_STEP = -24
+    ZOOM_MAX_STEP = 31
+    # Escalas suaves com destino acima desta área rodam em ImageScaleThread; enquanto isso a interface mostra a versão rápida.
+    ASYNC_SCALE_PIXELS = 1_000_000
+    # Espera após o último giro da roda antes de refazer a escala com filtro suave.
+    SMOOTH_ZOOM_DELAY_MS = 150
+    # Vizinhos decodificados antecipadamente após cada carregamento, na ordem de prioridade.
+    PREFETCH_OFFSETS = (1, -1, 2)
+    PREFETCH_CACHE_SIZE = 8
+    # Geometria (x, y, largura, altura) dos widgets fixos na resolução base de 1920x1080.
+    _BASE_GEOMETRY = {
+        'header_widget': (320, 40, 1280, 50),
+        'video_widget': (320, 100, 1280, 870),
+        'btn_carregar': (40, 380, 200, 50),
+        'btn_cores': (40, 460, 200, 50),
+        'btn_personalizar': (40, 540, 200, 50),
+        'btn_salvar': (40, 620, 200, 50),
+        'btn_num1': (1660, 380, 46, 50),
+        'btn_num2': (1711, 380, 46, 50),
+        'btn_num3': (1762, 380, 46, 50),
+        'btn_num4': (1813, 380, 46, 50),
+        'btn_erro': (1660, 460, 200, 50),
+        'btn_avaliacao': (1660, 540, 200, 50),
+        'lbl_contador': (1660, 620, 200, 50),
+        'btn_minimizar': (1710, 10, 60, 30),
+        'btn_restaurar': (1780, 10, 60, 30),
+        'btn_fechar': (1850, 10, 60, 30),
+        'logo_cnpq': (40, 905, 190, 65),
+        'logo_utfpr': (1663, 905, 190, 65),
+    }
+    _BASE_GEOMETRY_NAMES = tuple(_BASE_GEOMETRY)
+    _BASE_GEOMETRY_ARRAY = np.array(tuple(_BASE_GEOMETRY.values()), dtype=np.float64)
+
     def __init__(self):
         """ Inicializa a janela principal, configura escala de resolução, player de áudio e variáveis de estado. """
         super().__init__()
@@ -1388,16 +2073,39 @@ class MainWindow(QMainWindow):
         self.easter_egg_active = False
         self.ultimo_estado_avaliacao = None
         self.erros_atuais = []
+        # Lista de mídias do ZIP aberto; vazia enquanto nenhum ZIP foi carregado.
+        self.media_files = []
         self.resultado_file = os.path.join("BENAPRO", "resultado.json")
+        # Último resultado.json lido ou gravado: (caminho, mtime_ns, tamanho, dados). Evita reler o arquivo a cada anotação.
+        self._resultado_cache = None
+        # Índice zip -> arquivo -> entrada, válido enquanto _entry_index_data for o mesmo dicionário de resultados.
+        self._entry_index = {}
+        self._entry_index_data = None
         os.makedirs("BENAPRO", exist_ok=True)
         self.current_color_filter = 'normal'
         self.original_pixmap = None
         self.current_file_path = None
         self._rgba_available = False
         self._pending_media_index = None
+        self._load_token = 0
+        self._worker_threads = set()
+        self.temp_dir = None
+        self._prefetcher = ImagePrefetcher(max_entries=self.PREFETCH_CACHE_SIZE)
         self._media_nav_timer = QTimer(self)
         self._media_nav_timer.setSingleShot(True)
         self._media_nav_timer.timeout.connect(self._flush_pending_media_load)
+        self._smooth_zoom_timer = QTimer(self)
+        self._smooth_zoom_timer.setSingleShot(True)
+        self._smooth_zoom_timer.timeout.connect(self._update_image_display)
+        # Eventos de roda dentro de um quadro (~16 ms) são somados em um único redesenho.
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+        self._zoom_anchor = None
+        # Escala suave em andamento: (token, cacheKey do pixmap de origem, chave do _zoom_cache, chave do QPixmapCache).
+        self._scale_token = 0
+        self._pending_scale = None
         
         self.init_ui()
         self.showFullScreen()
@@ -1414,67 +2122,149 @@ class MainWindow(QMainWindow):
         """ Escala um tamanho de fonte ou dimensão mantendo proporção mínima entre escala x e y. """
         return int(size * min(self.scale_x, self.scale_y))
 
+    def scaled_geometries(self):
+        """ Escala todas as geometrias base de uma vez com numpy e retorna um dicionário nome -> (x, y, largura, altura) em inteiros. """
+        escala = np.array((self.scale_x, self.scale_y, self.scale_x, self.scale_y))
+        scaled = (self._BASE_GEOMETRY_ARRAY * escala).astype(np.int32).tolist()
+        return dict(zip(self._BASE_GEOMETRY_NAMES, map(tuple, scaled)))
+
+    def prepare_cached_styles(self):
+        """ Retorna as folhas de estilo da janela principal, geradas uma única vez por escala de tela e reaproveitadas entre instâncias. """
+        key = (round(self.scale_x, 3), round(self.scale_y, 3))
+        styles = self._STYLE_CACHE.get(key)
+        if styles is None:
+            sf = self.sf
+            styles = {
+                'btn_large': f"""
+                    QPushButton {{
+                        background-color: #4a4a4a;
+                        border: 1px solid #6a6a6a;
+                        border-radius: {sf(5)}px;
+                        padding: {sf(10)}px;
+                        color: white;
+                        font-size: {sf(18)}px;
+                    }}
+                    QPushButton:hover {{
+                        background-color: #6a6a6a;  /* Mais claro ao passar o mouse */
+                        border: 1px solid #8a8a8a;
+                    }}
+                    QPushButton:pressed {{
+                        background-color: #3a3a3a;
+                        border: 1px solid #4a4a4a;
+                    }}
+                """,
+                'btn_num': f"""
+                    QPushButton {{
+                        background-color: #4a4a4a;
+                        color: white;
+                        font-size: {sf(18)}px;
+                        border: 2px solid #6a6a6a;
+                        border-radius: {sf(5)}px;
+                    }}
+                    QPushButton:hover {{
+                        background-color: #6a6a6a; /* Hover nos números também */
+                    }}
+                    QPushButton:checked {{
+                        background-color: #0080FF;
+                        border-color: #00CCFF;
+                        font-weight: bold;
+                    }}
+                """,
+                'field': f"""
+                    QLabel {{
+                        background-color: #3a3a3a;
+                        border: 1px solid #5a5a5a;
+                        color: white;
+                        font-size: {sf(26)}px; 
+                        padding: {sf(5)}px {sf(25)}px; 
+                    }}
+                """,
+                'field_expanded': f"""
+                    QLabel {{
+                        background-color: #3a3a3a;
+                        border: 1px solid #5a5a5a;
+                        color: white;
+                        font-size: {sf(26)}px;
+                        padding: {sf(5)}px {sf(35)}px {sf(5)}px {sf(35)}px;
+                    }}
+                """,
+                'contador': f"""
+                    QLabel {{
+                        color: white; 
+                        font-size: {sf(18)}px; 
+                        font-weight: bold;
+                        background-color: rgba(0, 0, 0, 150);
+                        border: 2px solid white; 
+                        border-radius: {sf(5)}px;
+                    }}
+                """,
+                'contador_avaliado': f"""
+                    QLabel {{
+                        color: #00FF00; 
+                        font-size: {sf(18)}px; 
+                        font-weight: bold;
+                        background-color: rgba(0, 50, 0, 150);
+                        border: 2px solid #00FF00; 
+                        border-radius: {sf(5)}px;
+                    }}
+                """,
+                'contador_pendente': f"""
+                    QLabel {{
+                        color: #FF0000; 
+                        font-size: {sf(18)}px; 
+                        font-weight: bold;
+                        background-color: rgba(50, 0, 0, 150);
+                        border: 2px solid #FF0000; 
+                        border-radius: {sf(5)}px;
+                    }}
+                """,
+                'win_ctrl': f"""
+                    QPushButton {{
+                        background-color: #4a4a4a;
+                        border: 1px solid #6a6a6a;
+                        border-radius: {sf(5)}px;
+                        padding: {sf(5)}px;
+                    }}
+                    QPushButton:hover {{
+                        background-color: #5a5a5a;
+                    }}
+                    QPushButton:pressed {{
+                        background-color: #3a3a3a;
+                    }}
+                """,
+                'close': f"""
+                    QPushButton {{
+                        background-color: #4a4a4a;
+                        border: 1px solid #6a6a6a;
+                        border-radius: {sf(5)}px;
+                        padding: {sf(5)}px;
+                    }}
+                    QPushButton:hover {{
+                        background-color: #ff4444;
+                    }}
+                    QPushButton:pressed {{
+                        background-color: #dd3333;
+                    }}
+                """,
+            }
+            self._STYLE_CACHE[key] = styles
+        return styles
+
     def init_ui(self):
         """ Constrói toda a interface gráfica incluindo botões, labels, área de visualização e controles. """
-        style_btn_large = f"""
-            QPushButton {{
-                background-color: #4a4a4a;
-                border: 1px solid #6a6a6a;
-                border-radius: {self.sf(5)}px;
-                padding: {self.sf(10)}px;
-                color: white;
-                font-size: {self.sf(18)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #6a6a6a;  /* Mais claro ao passar o mouse */
-                border: 1px solid #8a8a8a;
-            }}
-            QPushButton:pressed {{
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-            }}
-        """
-        
-        style_btn_num = f"""
-            QPushButton {{
-                background-color: #4a4a4a;
-                color: white;
-                font-size: {self.sf(18)}px;
-                border: 2px solid #6a6a6a;
-                border-radius: {self.sf(5)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #6a6a6a; /* Hover nos números também */
-            }}
-            QPushButton:checked {{
-                background-color: #0080FF;
-                border-color: #00CCFF;
-                font-weight: bold;
-            }}
-        """
-
-        self.style_field = f"""
-            QLabel {{
-                background-color: #3a3a3a;
-                border: 1px solid #5a5a5a;
-                color: white;
-                font-size: {self.sf(26)}px; 
-                padding: {self.sf(5)}px {self.sf(25)}px; 
-            }}
-        """
-        
-        self.style_field_expanded = f"""
-            QLabel {{
-                background-color: #3a3a3a;
-                border: 1px solid #5a5a5a;
-                color: white;
-                font-size: {self.sf(26)}px;
-                padding: {self.sf(5)}px {self.sf(35)}px {self.sf(5)}px {self.sf(35)}px;
-            }}
-        """
+        styles = self.prepare_cached_styles()
+        geometry = self.scaled_geometries()
+        style_btn_large = styles['btn_large']
+        style_btn_num = styles['btn_num']
+        self.style_field = styles['field']
+        self.style_field_expanded = styles['field_expanded']
+        # Folhas do contador indexadas por "avaliado?", para trocar sem montar e reinterpretar o CSS a cada navegação.
+        self.style_contador = {True: styles['contador_avaliado'], False: styles['contador_pendente']}
+        # (índice, total, avaliado?) já exibido pelo contador; evita setText/setStyleSheet repetidos.
+        self._last_contador_state = None
 
         self.header_widget = QWidget(self)
-        self.header_widget.setGeometry(self.sx(320), self.sy(40), self.sx(1280), self.sy(50))
+        self.header_widget.setGeometry(*geometry['header_widget'])
         
         header_layout = QHBoxLayout(self.header_widget)
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -1505,14 +2295,14 @@ class MainWindow(QMainWindow):
         self.lbl_camada.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(self.lbl_camada)
 
+        # Modo atual do cabeçalho ('header' ou 'data'); set_data_mode roda a cada navegação e vira no-op quando nada muda.
+        self._header_mode = None
         self.set_header_mode()
         
         self.header_widget.show()
 
-        video_h_original = 870 
-        
         self.video_widget = QWidget(self)
-        self.video_widget.setGeometry(self.sx(320), self.sy(100), self.sx(1280), self.sy(video_h_original))
+        self.video_widget.setGeometry(*geometry['video_widget'])
         self.video_widget.setStyleSheet("background-color: black;")
 
         self.scroll_area = QScrollArea(self.video_widget)
@@ -1521,7 +2311,7 @@ class MainWindow(QMainWindow):
         self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.scroll_area.setStyleSheet("background-color: black; border: none;")
         
-        self.logo_centro = QLabel()
+        self.logo_centro = ZoomLabel()
         self.logo_centro.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.logo_centro.setStyleSheet("background-color: black;")
         self.logo_centro.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -1530,196 +2320,156 @@ class MainWindow(QMainWindow):
         self.scroll_area.setWidget(self.logo_centro)
         
         self.zoom_factor = 1.0
+        self._zoom_step = 0.0
         self.current_processed_pixmap = None 
-
-        self.logo_centro.installEventFilter(self)
+        self._processed_key = None
+        # Versões já escaladas de current_processed_pixmap por (largura, altura, suave), em ordem LRU; limpo quando a imagem muda.
+        self._zoom_cache = OrderedDict()
+        self._zoom_cache_bytes = 0
+        # Reduções sucessivas pela metade de current_processed_pixmap, montadas sob demanda para zooms de afastamento.
+        self._zoom_pyramid = []
+        # (pixmap processado, largura, altura, suave) do último desenho e cacheKey do pixmap entregue ao label.
+        self._last_render = None
+
+        # Só cliques, arrasto e roda chegam ao Python; pinturas e demais eventos não passam por um eventFilter.
+        self.logo_centro.input_handler = self
 
         self.create_navigation_buttons()
         
         self.load_processed_image(self.logo_centro, "UTFPR_biometria.png", self.sx(380), self.sy(380), opacity=0.3)
 
         self.btn_carregar = QPushButton("Carregar ZIP", self)
-        self.btn_carregar.setGeometry(self.sx(40), self.sy(380), self.sx(200), self.sy(50))
+        self.btn_carregar.setGeometry(*geometry['btn_carregar'])
         self.btn_carregar.setStyleSheet(style_btn_large)
         self.btn_carregar.clicked.connect(self.load_zip_file)
 
         self.btn_cores = QPushButton("Cores", self)
-        self.btn_cores.setGeometry(self.sx(40), self.sy(460), self.sx(200), self.sy(50))
+        self.btn_cores.setGeometry(*geometry['btn_cores'])
         self.btn_cores.setStyleSheet(style_btn_large)
         self.btn_cores.clicked.connect(self.open_color_filters)
 
         self.btn_personalizar = QPushButton("Personalizar Erros", self)
-        self.btn_personalizar.setGeometry(self.sx(40), self.sy(540), self.sx(200), self.sy(50))
+        self.btn_personalizar.setGeometry(*geometry['btn_personalizar'])
         self.btn_personalizar.setStyleSheet(style_btn_large)
         self.btn_personalizar.clicked.connect(self.open_custom_errors)
 
         self.btn_salvar = QPushButton("Salvar", self)
-        self.btn_salvar.setGeometry(self.sx(40), self.sy(620), self.sx(200), self.sy(50))
+        self.btn_salvar.setGeometry(*geometry['btn_salvar'])
         self.btn_salvar.setStyleSheet(style_btn_large)
         self.btn_salvar.clicked.connect(self.salvar_anotacao)
 
         self.btn_num1 = QPushButton("1", self)
         self.btn_num1.setCheckable(True)
-        self.btn_num1.setGeometry(self.sx(1660), self.sy(380), self.sx(46), self.sy(50))
+        self.btn_num1.setGeometry(*geometry['btn_num1'])
         self.btn_num1.setStyleSheet(style_btn_num)
         self.btn_num1.clicked.connect(lambda: self.selecionar_camada(1))
 
         self.btn_num2 = QPushButton("2", self)
         self.btn_num2.setCheckable(True)
-        self.btn_num2.setGeometry(self.sx(1711), self.sy(380), self.sx(46), self.sy(50))
+        self.btn_num2.setGeometry(*geometry['btn_num2'])
         self.btn_num2.setStyleSheet(style_btn_num)
         self.btn_num2.clicked.connect(lambda: self.selecionar_camada(2))
 
 
         self.btn_num3 = QPushButton("3", self)
         self.btn_num3.setCheckable(True)
-        self.btn_num3.setGeometry(self.sx(1762), self.sy(380), self.sx(46), self.sy(50))
+        self.btn_num3.setGeometry(*geometry['btn_num3'])
         self.btn_num3.setStyleSheet(style_btn_num)
         self.btn_num3.clicked.connect(lambda: self.selecionar_camada(3))
 
         self.btn_num4 = QPushButton("4", self)
         self.btn_num4.setCheckable(True)
-        self.btn_num4.setGeometry(self.sx(1813), self.sy(380), self.sx(46), self.sy(50))
+        self.btn_num4.setGeometry(*geometry['btn_num4'])
         self.btn_num4.setStyleSheet(style_btn_num)
         self.btn_num4.clicked.connect(lambda: self.selecionar_camada(4))
 
         self.camada_buttons = [self.btn_num1, self.btn_num2, self.btn_num3, self.btn_num4]
         self.camada_atual = None 
         self.canais_rgba = None  
+        # Pixmaps das camadas já convertidas para a imagem atual (índice = camada - 1).
+        self._camada_pixmap_cache = [None] * 4
 
         self.btn_erro = QPushButton("Erro", self)
-        self.btn_erro.setGeometry(self.sx(1660), self.sy(460), self.sx(200), self.sy(50))
+        self.btn_erro.setGeometry(*geometry['btn_erro'])
         self.btn_erro.setStyleSheet(style_btn_large)
         self.btn_erro.clicked.connect(self.open_erro_selector)
 
         self.btn_avaliacao = QPushButton("Avaliação", self)
-        self.btn_avaliacao.setGeometry(self.sx(1660), self.sy(540), self.sx(200), self.sy(50))
+        self.btn_avaliacao.setGeometry(*geometry['btn_avaliacao'])
         self.btn_avaliacao.setStyleSheet(style_btn_large)
         self.btn_avaliacao.clicked.connect(self.abrir_janela_avaliacao)
 
         self.lbl_contador = QLabel("0/0", self)
-        self.lbl_contador.setGeometry(self.sx(1660), self.sy(620), self.sx(200), self.sy(50))
+        self.lbl_contador.setGeometry(*geometry['lbl_contador'])
         self.lbl_contador.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.lbl_contador.setStyleSheet(f"""
-            QLabel {{
-                color: white; 
-                font-size: {self.sf(18)}px; 
-                font-weight: bold;
-                background-color: rgba(0, 0, 0, 150);
-                border: 2px solid white; 
-                border-radius: {self.sf(5)}px;
-            }}
-        """)
+        self.lbl_contador.setStyleSheet(styles['contador'])
 
-        style_win_ctrl = f"""
-            QPushButton {{
-                background-color: #4a4a4a;
-                border: 1px solid #6a6a6a;
-                border-radius: {self.sf(5)}px;
-                padding: {self.sf(5)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #5a5a5a;
-            }}
-            QPushButton:pressed {{
-                background-color: #3a3a3a;
-            }}
-        """
-        
-        style_close = f"""
-            QPushButton {{
-                background-color: #4a4a4a;
-                border: 1px solid #6a6a6a;
-                border-radius: {self.sf(5)}px;
-                padding: {self.sf(5)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #ff4444;
-            }}
-            QPushButton:pressed {{
-                background-color: #dd3333;
-            }}
-        """
+        style_win_ctrl = styles['win_ctrl']
+        style_close = styles['close']
 
         self.btn_minimizar = QPushButton(self)
         self.btn_minimizar.setIcon(self.create_icon(QStyle.StandardPixmap.SP_TitleBarMinButton))
-        self.btn_minimizar.setGeometry(self.sx(1710), self.sy(10), self.sx(60), self.sy(30))
+        self.btn_minimizar.setGeometry(*geometry['btn_minimizar'])
         self.btn_minimizar.setStyleSheet(style_win_ctrl)
         self.btn_minimizar.setToolTip("Minimizar")
         self.btn_minimizar.clicked.connect(self.showMinimized)
 
         self.btn_restaurar = QPushButton(self)
         self.btn_restaurar.setIcon(self.create_icon(QStyle.StandardPixmap.SP_TitleBarMaxButton))
-        self.btn_restaurar.setGeometry(self.sx(1780), self.sy(10), self.sx(60), self.sy(30))
+        self.btn_restaurar.setGeometry(*geometry['btn_restaurar'])
         self.btn_restaurar.setStyleSheet(style_win_ctrl)
         self.btn_restaurar.setToolTip("Restaurar visualização")
         self.btn_restaurar.clicked.connect(self.reset_zoom)
 
         self.btn_fechar = QPushButton(self)
         self.btn_fechar.setIcon(self.create_icon(QStyle.StandardPixmap.SP_TitleBarCloseButton))
-        self.btn_fechar.setGeometry(self.sx(1850), self.sy(10), self.sx(60), self.sy(30))
+        self.btn_fechar.setGeometry(*geometry['btn_fechar'])
         self.btn_fechar.setStyleSheet(style_close)
         self.btn_fechar.clicked.connect(self.close)
 
         self.logo_cnpq = ClickableLabel(self)
-        self.logo_cnpq.setGeometry(self.sx(40), self.sy(905), self.sx(190), self.sy(65))
-        self.load_processed_image(self.logo_cnpq, "CNPQ.png", self.sx(190), self.sy(65), opacity=1.0)
+        self.logo_cnpq.setGeometry(*geometry['logo_cnpq'])
+        self.load_processed_image(self.logo_cnpq, "CNPQ.png", *geometry['logo_cnpq'][2:], opacity=1.0)
         self.logo_cnpq.setCursor(Qt.CursorShape.PointingHandCursor)
         self.logo_cnpq.setToolTip("Abrir manual do BenaPRO")
         self.logo_cnpq.clicked.connect(self.open_manual)
         
         self.logo_utfpr = ClickableLabel(self)
-        self.logo_utfpr.setGeometry(self.sx(1663), self.sy(905), self.sx(190), self.sy(65))
-        self.load_processed_image(self.logo_utfpr, "UTFPR.png", self.sx(190), self.sy(65), opacity=1.0)
+        self.logo_utfpr.setGeometry(*geometry['logo_utfpr'])
+        self.load_processed_image(self.logo_utfpr, "UTFPR.png", *geometry['logo_utfpr'][2:], opacity=1.0)
         self.logo_utfpr.setCursor(Qt.CursorShape.PointingHandCursor)
         self.logo_utfpr.setToolTip("Abrir site do projeto")
         self.logo_utfpr.clicked.connect(self.open_project_site)
 
-    def create_icon(self, standard_pixmap):
-        """ Cria um ícone branco estilizado a partir de um ícone padrão do sistema. """
-        icon = self.style().standardIcon(standard_pixmap)
-        pix = icon.pixmap(self.sf(16), self.sf(16))
-        mask = pix.mask()
-        pix.fill(QColor("white"))
-        pix.setMask(mask)
-        return QIcon(pix)
-
     def load_processed_image(self, label, filename, w, h, opacity=1.0):
         """ Carrega a imagem e aplica o efeito de silhueta branca + opacidade, idêntico ao código original do Benapro.py """
-        path = resource_path(os.path.join("Fotos", filename))
+        cache_key = f"{filename}:{w}x{h}:{opacity}"
+        final_pixmap = QPixmapCache.find(cache_key)
         
-        if os.path.exists(path):
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                
-                white_pixmap = QPixmap(scaled.size())
-                white_pixmap.fill(Qt.GlobalColor.transparent)
-                
-                painter = QPainter(white_pixmap)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-                painter.drawPixmap(0, 0, scaled)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-                painter.fillRect(white_pixmap.rect(), Qt.GlobalColor.white)
-                painter.end()
-                
-                final_pixmap = white_pixmap
-                if opacity < 1.0:
-                    transparent_pixmap = QPixmap(white_pixmap.size())
-                    transparent_pixmap.fill(Qt.GlobalColor.transparent)
+        if final_pixmap is None:
+            path = resource_path(os.path.join("Fotos", filename))
+            if os.path.exists(path):
+                pixmap = QPixmap(path)
+                if not pixmap.isNull():
+                    scaled = pixmap.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                     
-                    painter2 = QPainter(transparent_pixmap)
-                    painter2.setOpacity(opacity)
-                    painter2.drawPixmap(0, 0, white_pixmap)
-                    painter2.end()
-                    final_pixmap = transparent_pixmap
-                
-                label.setPixmap(final_pixmap)
-                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                if label is getattr(self, 'logo_centro', None):
-                    label.resize(final_pixmap.size())
-                return
+                    img = scaled.toImage().convertToFormat(QImage.Format.Format_ARGB32)
+                    arr = qimage_pixels(img)
+                    arr[..., 0:3] = 255
+                    if opacity < 1.0:
+                        alpha = arr[..., 3]
+                        alpha[...] = alpha.astype(np.uint16) * int(opacity * 255) // 255
+                    final_pixmap = QPixmap.fromImage(img)
+                    
+                    QPixmapCache.insert(cache_key, final_pixmap)
+        
+        if final_pixmap is not None:
+            label.setPixmap(final_pixmap)
+            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            if label is getattr(self, 'logo_centro', None):
+                label.resize(final_pixmap.size())
+            return
         
         label.setText(filename.replace(".png", ""))
         label.setStyleSheet("color: rgba(255,255,255,100); font-weight: bold; border: 1px dashed #555;")
@@ -1800,14 +2550,8 @@ class MainWindow(QMainWindow):
             self.erro_dialog.activateWindow()
             return
         
-        custom_errors = {}
-        path_json = find_catalog_file("catalogo_erros.json")
-        if os.path.exists(path_json):
-             try:
-                 with open(path_json, 'r', encoding='utf-8') as f:
-                     custom_errors = json.load(f)
-             except:
-                 pass
+        # load_catalog só decodifica o JSON de novo quando o mtime/tamanho do arquivo mudou.
+        custom_errors = load_catalog(find_catalog_file("catalogo_erros.json")) or {}
 
         self.erro_dialog = ErroDialog(self, custom_errors)
         # Sincroniza o estado de erros mesmo ao fechar/cancelar, evitando avaliação com seleção antiga.
@@ -1876,9 +2620,14 @@ class MainWindow(QMainWindow):
                 self.logo_centro.setStyleSheet("color: red; font-size: 40px; font-weight: bold;")
 
     def create_icon(self, standard_pixmap):
-        """ Cria um ícone colorido com alta qualidade (igual ao Benapro.py) """
-        icon = self.style().standardIcon(standard_pixmap)
+        """ Cria um ícone colorido com alta qualidade (igual ao Benapro.py); reaproveita o ícone já gerado para o mesmo ícone padrão e tamanho. """
         size = self.sf(16) 
+        key = (standard_pixmap, size)
+        cached = self._ICON_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        icon = self.style().standardIcon(standard_pixmap)
         pixmap = icon.pixmap(size, size)
         
         colored_pixmap = QPixmap(size, size)
@@ -1891,7 +2640,9 @@ class MainWindow(QMainWindow):
         painter.fillRect(colored_pixmap.rect(), QColor("white"))
         painter.end()
         
-        return QIcon(colored_pixmap)
+        icon = QIcon(colored_pixmap)
+        self._ICON_CACHE[key] = icon
+        return icon
 
     def abrir_janela_avaliacao(self):
         """ Abre a janela de avaliação dos erros selecionados com sistema de estrelas. """
@@ -1940,18 +2691,49 @@ class MainWindow(QMainWindow):
         self.ultimo_estado_avaliacao = None
         
 
+    def release_image_data(self):
+        """ Solta toda referência às imagens extraídas (threads em segundo plano, pré-carga, canais e pixmaps); no Windows arquivos mapeados não podem ser apagados. """
+        self._load_token += 1
+        for worker in list(self._worker_threads):
+            worker.wait()
+        # Entrega os resultados já enfileirados, que são descartados pelo token e liberam seus canais.
+        QCoreApplication.sendPostedEvents(self, QEvent.Type.MetaCall)
+        self._prefetcher.clear()
+        self.canais_rgba = None
+        self._camada_pixmap_cache = [None] * 4
+        self.original_pixmap = None
+        self.master_pixmap = None
+
+    def remove_temp_dir(self):
+        """ Apaga a pasta temporária do ZIP atual depois de soltar as imagens que ainda apontam para ela. """
+        if not self.temp_dir or not os.path.exists(self.temp_dir):
+            return
+        self.release_image_data()
+        try:
+            shutil.rmtree(self.temp_dir)
+        except OSError as e:
+            print(f"Erro ao remover pasta temporária: {e}")
+        self.temp_dir = None
+
+    def closeEvent(self, event):
+        """ Ao fechar o programa, espera as threads em segundo plano, encerra o pool de pré-carga e remove a pasta temporária do ZIP. """
+        self.remove_temp_dir()
+        for worker in list(self._worker_threads):
+            worker.wait()
+        self._prefetcher.shutdown()
+        super().closeEvent(event)
+
     def load_zip_file(self):
         """ Abre seletor de arquivo ZIP e inicia thread de extração em segundo plano. """
         file_path, _ = QFileDialog.getOpenFileName(self, "Selecionar Arquivo ZIP", "", "Arquivos ZIP (*.zip)")
         if not file_path:
             return
 
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            try: shutil.rmtree(self.temp_dir)
-            except: pass
+        self.remove_temp_dir()
 
         self.temp_dir = tempfile.mkdtemp()
         self.current_zip_name = os.path.basename(file_path)
+        QPixmapCache.clear()
         self.media_files = []
         self.current_media_index = 0
         self._pending_media_index = None
@@ -1979,7 +2761,7 @@ class MainWindow(QMainWindow):
         
         first_unevaluated_index = 0
         for i, item in enumerate(self.media_files):
-            if item['filename'] not in self.evaluated_files:
+            if item.filename not in self.evaluated_files:
                 first_unevaluated_index = i
                 break
         
@@ -2004,7 +2786,7 @@ class MainWindow(QMainWindow):
 
     def request_media_load(self, target_index, immediate=False):
         """ Agenda o carregamento da imagem atual com debounce para evitar sobrecarga em navegaÃ§Ã£o rÃ¡pida. """
-        if not hasattr(self, 'media_files') or not self.media_files:
+        if not self.media_files:
             return
 
         target_index = max(0, min(target_index, len(self.media_files) - 1))
@@ -2021,7 +2803,7 @@ class MainWindow(QMainWindow):
         """ Executa o Ãºltimo carregamento pendente de imagem solicitado pela navegaÃ§Ã£o. """
         if self._pending_media_index is None:
             return
-        if not hasattr(self, 'media_files') or not self.media_files:
+        if not self.media_files:
             self._pending_media_index = None
             return
 
@@ -2035,25 +2817,54 @@ class MainWindow(QMainWindow):
             return
 
         item = self.media_files[self.current_media_index]
-        file_path = item['file_path'] 
+        file_path = item.file_path 
         self.current_file_path = file_path
         
-        self.lbl_id.setText(str(item['id']).upper())
-        self.lbl_data.setText(str(item['data']))
-        self.lbl_dedo.setText(str(item['dedo']))
-        self.lbl_frame.setText(f"Frame: {item.get('frame', 0)}")
+        self.lbl_id.setText(str(item.id).upper())
+        self.lbl_data.setText(str(item.data))
+        self.lbl_dedo.setText(str(item.dedo))
+        self.lbl_frame.setText(f"Frame: {item.frame}")
         self.set_data_mode()
         
         self.camada_atual = None
         self.canais_rgba = None
+        self._camada_pixmap_cache = [None] * 4
         self._rgba_available = False
         for btn in self.camada_buttons:
             btn.setChecked(False)
             btn.setEnabled(False) 
 
-        img_cv = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
+        # Até a nova imagem chegar, filtros e reset não podem reaproveitar os pixmaps da imagem anterior.
+        self.original_pixmap = None
+        self.master_pixmap = None
+        self._load_token += 1
+        cached = self._prefetcher.get(file_path)
+        if cached is not None:
+            self.on_image_loaded(self._load_token, file_path, *cached)
+            return
+
+        loader = ImageLoaderThread(self._load_token, file_path, self)
+        loader.loaded.connect(self.on_image_loaded)
+        self._worker_threads.add(loader)
+        loader.finished.connect(self.on_worker_finished)
+        loader.finished.connect(loader.deleteLater)
+        loader.start()
+
+    def on_worker_finished(self):
+        """ Tira a thread de leitura ou de escala encerrada do conjunto de threads em andamento. """
+        self._worker_threads.discard(self.sender())
+
+    def on_image_loaded(self, token, file_path, image, canais):
+        """ Recebe a imagem decodificada em segundo plano; ignora resultados de navegações já substituídas. """
+        if token != self._load_token:
+            return
+
+        if not image.isNull():
+            self._prefetcher.store(file_path, (image, canais))
+        self.prefetch_neighbors()
 
-        if img_cv is not None and img_cv.ndim == 3 and img_cv.shape[2] == 4:
+        self.canais_rgba = canais
+        if canais is not None:
             self.lbl_camada.setText("4 Camadas")
             self._rgba_available = True
             
@@ -2063,7 +2874,7 @@ class MainWindow(QMainWindow):
         else:
             self.lbl_camada.setText("Imagem Normal")
 
-        pixmap = QPixmap(file_path)
+        pixmap = QPixmap.fromImage(image)
         self.original_pixmap = pixmap
         self.master_pixmap = pixmap
         
@@ -2081,22 +2892,25 @@ class MainWindow(QMainWindow):
         self.btn_prev_img.raise_()
         self.btn_next_img.raise_()         
 
-    def update_contador_ui(self):
-        """ Atualiza o contador de navegação e altera sua cor conforme status de avaliação. """
-        if hasattr(self, 'media_files') and self.media_files:
-            self.lbl_contador.setText(f"{self.current_media_index + 1}/{len(self.media_files)}")
-        else:
-            self.lbl_contador.setText("0/0")
-    
+    def prefetch_neighbors(self):
+        """ Agenda a decodificação das imagens vizinhas para que a navegação com as setas encontre a próxima já pronta. """
+        total = len(self.media_files)
+        caminhos = [
+            self.media_files[i].file_path
+            for i in (self.current_media_index + offset for offset in self.PREFETCH_OFFSETS)
+            if 0 <= i < total
+        ]
+        self._prefetcher.prefetch(caminhos)
+
     def next_image(self):
         """ Avança para a próxima imagem na lista de mídias carregadas. """
-        if hasattr(self, 'media_files') and self.media_files:
+        if self.media_files:
             if self.current_media_index < len(self.media_files) - 1:
                 self.request_media_load(self.current_media_index + 1)
 
     def prev_image(self):
         """ Retorna para a imagem anterior na lista de mídias carregadas. """
-        if hasattr(self, 'media_files') and self.media_files:
+        if self.media_files:
             if self.current_media_index > 0:
                 self.request_media_load(self.current_media_index - 1)
     
@@ -2172,20 +2986,15 @@ class MainWindow(QMainWindow):
 
     def load_progress_data(self):
         """ Carrega do resultado.json quais arquivos já foram avaliados para o ZIP atual. """
-        self.evaluated_files = set()
-        
         data = self.load_resultado_json()
-        
-        if self.current_zip_name in data:
-            lista_entradas = data[self.current_zip_name]
-            for entrada in lista_entradas:
-                self.evaluated_files.add(entrada['arquivo'])
+        # O índice montado aqui é o mesmo que salvar_anotacao consulta depois, enquanto o arquivo não mudar.
+        self.evaluated_files = set(self.entradas_por_arquivo(data, self.current_zip_name))
 
     def save_current_as_evaluated(self):
         """ Marca a imagem atual como avaliada e pula automaticamente para a próxima pendente. """
         if not self.media_files: return
 
-        current_file = self.media_files[self.current_media_index]['filename']
+        current_file = self.media_files[self.current_media_index].filename
         self.evaluated_files.add(current_file)
         
         full_data = {}
@@ -2209,7 +3018,7 @@ class MainWindow(QMainWindow):
         start_index = self.current_media_index + 1
         
         for i in range(start_index, len(self.media_files)):
-            if self.media_files[i]['filename'] not in self.evaluated_files:
+            if self.media_files[i].filename not in self.evaluated_files:
                 self.current_media_index = i
                 self.request_media_load(self.current_media_index, immediate=True)
                 return
@@ -2218,52 +3027,75 @@ class MainWindow(QMainWindow):
 
     def update_contador_ui(self):
         """ Atualiza o texto e a cor do contador (Vermelho=Pendente, Verde=Feito). """
-        if not hasattr(self, 'media_files') or not self.media_files:
+        if not self.media_files:
+            self._last_contador_state = None
             self.lbl_contador.setText("0/0")
             return
 
-        current_file = self.media_files[self.current_media_index]['filename']
+        current_file = self.media_files[self.current_media_index].filename
         is_evaluated = current_file in self.evaluated_files
-        
-        color = "#00FF00" if is_evaluated else "#FF0000" 
-        bg_color = "rgba(0, 50, 0, 150)" if is_evaluated else "rgba(50, 0, 0, 150)"
+
+        state = (self.current_media_index, len(self.media_files), is_evaluated)
+        if state == self._last_contador_state:
+            return
+        self._last_contador_state = state
         
         self.lbl_contador.setText(f"{self.current_media_index + 1}/{len(self.media_files)}")
-        self.lbl_contador.setStyleSheet(f"""
-            QLabel {{
-                color: {color}; 
-                font-size: {self.sf(18)}px; 
-                font-weight: bold;
-                background-color: {bg_color};
-                border: 2px solid {color}; 
-                border-radius: {self.sf(5)}px;
-            }}
-        """)
+        style = self.style_contador[is_evaluated]
+        if self.lbl_contador.styleSheet() != style:
+            self.lbl_contador.setStyleSheet(style)
     
     def get_current_timestamp(self):
         """ Retorna o timestamp atual formatado para registro de avaliações. """
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def load_resultado_json(self):
-        """ Carrega a estrutura completa do arquivo resultado.json ou retorna dicionário vazio. """
-        if os.path.exists(self.resultado_file):
-            try:
-                with open(self.resultado_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Erro ao ler JSON: {e}")
-        return {}
+        """ Carrega a estrutura completa do arquivo resultado.json ou retorna dicionário vazio; reaproveita a cópia em memória enquanto o arquivo não mudar no disco. """
+        try:
+            stat = os.stat(self.resultado_file)
+        except OSError:
+            self._resultado_cache = None
+            return {}
+
+        cached = self._resultado_cache
+        if cached and cached[0] == self.resultado_file and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+            return cached[3]
+
+        try:
+            with open(self.resultado_file, 'rb') as f:
+                data = parse_json_bytes(f.read())
+        except Exception as e:
+            print(f"Erro ao ler JSON: {e}")
+            self._resultado_cache = None
+            return {}
+
+        self._resultado_cache = (self.resultado_file, stat.st_mtime_ns, stat.st_size, data)
+        return data
 
     def save_resultado_json(self, data):
         """ Persiste a estrutura de dados de resultados no arquivo resultado.json. """
         try:
-            with open(self.resultado_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json_atomic(self.resultado_file, data)
+            stat = os.stat(self.resultado_file)
+            self._resultado_cache = (self.resultado_file, stat.st_mtime_ns, stat.st_size, data)
             return True
         except Exception as e:
             print(f"Erro ao salvar JSON: {e}")
+            # Os dados em memória podem ter sido alterados antes da falha; a próxima leitura volta ao disco.
+            self._resultado_cache = None
             return False
     
+    def entradas_por_arquivo(self, resultado_data, zip_name):
+        """ Retorna o índice arquivo -> entrada do ZIP, reconstruído só quando o dicionário de resultados foi relido do disco. """
+        if resultado_data is not self._entry_index_data:
+            self._entry_index = {}
+            self._entry_index_data = resultado_data
+        indice = self._entry_index.get(zip_name)
+        if indice is None:
+            indice = {entrada['arquivo']: entrada for entrada in resultado_data.get(zip_name, [])}
+            self._entry_index[zip_name] = indice
+        return indice
+
     def salvar_anotacao(self):
         """ Valida e salva a avaliação completa da imagem atual no resultado.json. """
         if not self.verificar_zip_carregado():
@@ -2289,36 +3121,29 @@ class MainWindow(QMainWindow):
 
         item = self.media_files[self.current_media_index]
         
-        arquivo_para_salvar = item['filename']
-        
-        if item.get('type') == 'layered_video':
-            layers = item.get('layers', {})
-            first_layer = next(iter(layers.values())) if layers else None
-            ext = os.path.splitext(first_layer['filename'])[1] if first_layer else ""
-            arquivo_para_salvar = f"{item['base_name']}{ext}"
+        arquivo_para_salvar = item.filename
 
         resultado_data = self.load_resultado_json()
         
         if self.current_zip_name not in resultado_data:
             resultado_data[self.current_zip_name] = []
             
-        entrada_existente = None
-        for entrada in resultado_data[self.current_zip_name]:
-            if entrada['arquivo'] == arquivo_para_salvar:
-                entrada_existente = entrada
-                break
+        entradas = self.entradas_por_arquivo(resultado_data, self.current_zip_name)
+        entrada_existente = entradas.get(arquivo_para_salvar)
         
         if not entrada_existente:
             entrada_existente = {
                 "arquivo": arquivo_para_salvar,
-                "data": item['data'],
-                "id": item['id'],
-                "dedo": item['dedo'],
+                "data": item.data,
+                "id": item.id,
+                "dedo": item.dedo,
                 "erros": []
             }
             resultado_data[self.current_zip_name].append(entrada_existente)
+            entradas[arquivo_para_salvar] = entrada_existente
             
         camada_info = ""
+        erros_registrados = {(e['nome'], e['descricao']) for e in entrada_existente['erros']}
             
         for erro in self.erros_atuais:
             novo_erro = {
@@ -2328,13 +3153,9 @@ class MainWindow(QMainWindow):
                 "timestamp": self.get_current_timestamp()
             }
             
-            duplicado = any(
-                e['nome'] == novo_erro['nome'] and 
-                e['descricao'] == novo_erro['descricao'] 
-                for e in entrada_existente['erros']
-            )
-            
-            if not duplicado:
+            chave = (novo_erro['nome'], novo_erro['descricao'])
+            if chave not in erros_registrados:
+                erros_registrados.add(chave)
                 entrada_existente['erros'].append(novo_erro)
 
         if self.save_resultado_json(resultado_data):
@@ -2360,7 +3181,7 @@ class MainWindow(QMainWindow):
             
             QMessageBox.information(self, "Sucesso", mensagem_final)
 
-            self.evaluated_files.add(item['filename']) 
+            self.evaluated_files.add(item.filename) 
 
             self.limpar_formulario()
             
@@ -2424,20 +3245,45 @@ class MainWindow(QMainWindow):
 
     def apply_image_filter(self, filter_type):
         """ Aplica o filtro de processamento de imagem selecionado e atualiza a visualização. """
+        self.current_color_filter = filter_type
         if not hasattr(self, 'original_pixmap') or not self.original_pixmap:
             return
         
-        self.current_color_filter = filter_type
-        processed_pixmap = None
+        processed_key = f"filtro|{self.current_file_path}|{self.camada_atual}|{filter_type}"
 
         if filter_type == 'normal':
             processed_pixmap = self.original_pixmap
-            
-        elif filter_type == 'invert':
+        else:
+            processed_pixmap = QPixmapCache.find(processed_key)
+            if processed_pixmap is None:
+                processed_pixmap = self.render_image_filter(filter_type)
+                QPixmapCache.insert(processed_key, processed_pixmap)
+
+        # Reaplicar o mesmo filtro sobre o mesmo pixmap mantém as escalas já calculadas.
+        if self.current_processed_pixmap is None or processed_pixmap.cacheKey() != self.current_processed_pixmap.cacheKey():
+            self._zoom_cache.clear()
+            self._zoom_cache_bytes = 0
+            self._zoom_pyramid = [processed_pixmap]
+        self.current_processed_pixmap = processed_pixmap
+        self._processed_key = processed_key
+        
+        self._update_image_display()
+
+    def render_image_filter(self, filter_type):
+        """ Gera a versão filtrada de original_pixmap; o resultado é guardado no QPixmapCache por apply_image_filter. """
+        if filter_type == 'invert':
             image = self.original_pixmap.toImage()
             image.invertPixels()
             processed_pixmap = QPixmap.fromImage(image)
             
+        elif filter_type in FILTER_LUTS and not self.original_pixmap.hasAlphaChannel():
+            image = self.original_pixmap.toImage().convertToFormat(QImage.Format.Format_RGB32)
+            pixels = qimage_pixels(image)
+            linhas = pixels.reshape(pixels.shape[0], -1)
+            cv2.LUT(linhas, FILTER_LUTS[filter_type], dst=linhas)
+            pixels[..., 3] = 255
+            processed_pixmap = QPixmap.fromImage(image)
+            
         elif filter_type == 'bright':
             processed_pixmap = QPixmap(self.original_pixmap.size())
             processed_pixmap.fill(Qt.GlobalColor.transparent)
@@ -2470,10 +3316,21 @@ class MainWindow(QMainWindow):
         
         else:
             processed_pixmap = self.original_pixmap
-
-        self.current_processed_pixmap = processed_pixmap
         
-        self._update_image_display()
+        return processed_pixmap
+
+    def zoom_source(self, final_w, final_h):
+        """ Retorna o menor nível da pirâmide que ainda cobre o tamanho pedido, criando as metades necessárias com halve_pixmap. """
+        if not self._zoom_pyramid or self._zoom_pyramid[0].cacheKey() != self.current_processed_pixmap.cacheKey():
+            self._zoom_pyramid = [self.current_processed_pixmap]
+        nivel = self._zoom_pyramid[-1]
+        while nivel.width() >= final_w * 2 and nivel.height() >= final_h * 2:
+            nivel = halve_pixmap(nivel)
+            self._zoom_pyramid.append(nivel)
+        for nivel in reversed(self._zoom_pyramid):
+            if nivel.width() >= final_w and nivel.height() >= final_h:
+                return nivel
+        return self._zoom_pyramid[0]
 
     def _update_image_display(self, smooth=True):
         """ Renderiza a imagem processada com o fator de zoom aplicado na área de visualização. """
@@ -2495,18 +3352,95 @@ class MainWindow(QMainWindow):
         final_w = max(1, int(base_w * self.zoom_factor))
         final_h = max(1, int(base_h * self.zoom_factor))
         
-        final_pix = self.current_processed_pixmap.scaled(
-            final_w, final_h,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
-        )
+        render_key = (self.current_processed_pixmap.cacheKey(), final_w, final_h, smooth)
+        if self._last_render and self._last_render[0] == render_key and self.logo_centro.content_key() == self._last_render[1]:
+            return
+
+        if final_w * final_h > self.VIEWPORT_RENDER_PIXELS:
+            # Em zoom alto o pixmap inteiro chegaria a gigabytes; basta o tamanho lógico para as barras de rolagem.
+            final_size = QSize(orig_w, orig_h).scaled(final_w, final_h, Qt.AspectRatioMode.KeepAspectRatio)
+            self.logo_centro.set_viewport_source(
+                self.zoom_source(final_w, final_h), final_size.width(), final_size.height(), smooth
+            )
+            self._last_render = (render_key, self.logo_centro.content_key())
+            return
+
+        cache_key = (final_w, final_h, smooth)
+        final_pix = self._zoom_cache.get(cache_key)
+        if final_pix is None:
+            # Só a versão suave vai para o QPixmapCache: é a que se repete ao revisitar a imagem; os passos rápidos da roda ficam no cache local.
+            shared_key = f"{self._processed_key}|{final_w}x{final_h}" if smooth else None
+            if shared_key:
+                final_pix = QPixmapCache.find(shared_key)
+            if final_pix is None and smooth and final_w * final_h > self.ASYNC_SCALE_PIXELS:
+                # Mostra já a escala rápida e troca pela suave quando a thread terminar (on_scale_done).
+                self.start_async_scale(cache_key, shared_key, final_w, final_h)
+                self._update_image_display(smooth=False)
+                return
+            if final_pix is None:
+                final_pix = self.zoom_source(final_w, final_h).scaled(
+                    final_w, final_h,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+                )
+                if shared_key:
+                    QPixmapCache.insert(shared_key, final_pix)
+            self.cache_zoom_pixmap(cache_key, final_pix)
+        else:
+            self._zoom_cache.move_to_end(cache_key)
         
         self.logo_centro.setUpdatesEnabled(False)
         self.logo_centro.setPixmap(final_pix)
         self.logo_centro.resize(final_pix.size())
+        self._last_render = (render_key, self.logo_centro.content_key())
         self.logo_centro.setUpdatesEnabled(True)
         self.logo_centro.update()
     
+    def cache_zoom_pixmap(self, cache_key, pixmap):
+        """ Guarda uma escala no _zoom_cache e descarta as mais antigas até caber em ZOOM_CACHE_BYTES; a mais recente sempre fica. """
+        old = self._zoom_cache.pop(cache_key, None)
+        if old is not None:
+            self._zoom_cache_bytes -= pixmap_bytes(old)
+        self._zoom_cache[cache_key] = pixmap
+        self._zoom_cache_bytes += pixmap_bytes(pixmap)
+        while self._zoom_cache_bytes > self.ZOOM_CACHE_BYTES and len(self._zoom_cache) > 1:
+            _, evicted = self._zoom_cache.popitem(last=False)
+            self._zoom_cache_bytes -= pixmap_bytes(evicted)
+
+    def start_async_scale(self, cache_key, shared_key, final_w, final_h):
+        """ Dispara a escala suave em segundo plano, a menos que o mesmo resultado já esteja sendo calculado. """
+        source_key = self.current_processed_pixmap.cacheKey()
+        pending = self._pending_scale
+        if pending and pending[1] == source_key and pending[2] == cache_key:
+            return
+        self._scale_token += 1
+        self._pending_scale = (self._scale_token, source_key, cache_key, shared_key)
+        image = self.zoom_source(final_w, final_h).toImage()
+        worker = ImageScaleThread(self._scale_token, image, final_w, final_h, self)
+        worker.done.connect(self.on_scale_done)
+        self._worker_threads.add(worker)
+        worker.finished.connect(self.on_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def on_scale_done(self, token, image):
+        """ Guarda a escala suave pronta nos caches e a exibe se ainda corresponder à imagem e ao zoom atuais. """
+        pending = self._pending_scale
+        if pending is None or pending[0] != token:
+            return
+        self._pending_scale = None
+        _, source_key, cache_key, shared_key = pending
+        if not self.current_processed_pixmap or self.current_processed_pixmap.cacheKey() != source_key:
+            return
+
+        final_pix = QPixmap.fromImage(image)
+        if shared_key:
+            QPixmapCache.insert(shared_key, final_pix)
+        self.cache_zoom_pixmap(cache_key, final_pix)
+        # Se o usuário já mudou o zoom, a versão suave fica só no cache; o timer de zoom pedirá a nova.
+        if not self._smooth_zoom_timer.isActive() and not self._zoom_timer.isActive():
+            self._update_image_display(smooth=True)
+
     def selecionar_camada(self, numero):
         """ Alterna a visualização entre camadas RGBA individuais ou imagem original completa. """
         if not self.verificar_zip_carregado():
@@ -2527,8 +3461,8 @@ class MainWindow(QMainWindow):
             if not self.current_file_path:
                 return
 
-            img_cv = cv2.imread(self.current_file_path, cv2.IMREAD_UNCHANGED)
-            if img_cv is None or img_cv.ndim != 3 or img_cv.shape[2] != 4:
+            img_cv = rgba_uint8(cv2.imread(self.current_file_path, cv2.IMREAD_UNCHANGED))
+            if img_cv is None:
                 self._rgba_available = False
                 self.lbl_camada.setText("Imagem Normal")
                 for btn in self.camada_buttons:
@@ -2536,8 +3470,7 @@ class MainWindow(QMainWindow):
                     btn.setEnabled(False)
                 return
 
-            b, g, r, a = cv2.split(img_cv)
-            self.canais_rgba = [a, r, g, b]
+            self.canais_rgba = rgba_channel_views(img_cv)
 
         if self.camada_atual == numero:
             self.camada_atual = None
@@ -2555,7 +3488,6 @@ class MainWindow(QMainWindow):
             btn.setChecked((i + 1) == numero)
             btn.blockSignals(False)
 
-        canal = self.canais_rgba[numero - 1]
         
         nomes_camadas = {
             1: "Calibrado (Alpha)",
@@ -2565,78 +3497,117 @@ class MainWindow(QMainWindow):
         }
         self.lbl_camada.setText(nomes_camadas.get(numero, f"Camada {numero}"))
 
-        height, width = canal.shape
-        bytes_per_line = width
-        
-        q_img = QImage(canal.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale8)
-        
-        pixmap_camada = QPixmap.fromImage(q_img)
+        pixmap_camada = self._camada_pixmap_cache[numero - 1]
+        if pixmap_camada is None:
+            canal = self.canais_rgba[numero - 1]
+            if not canal.flags['C_CONTIGUOUS']:
+                # QImage Grayscale8 precisa de linhas contíguas; a cópia fica na lista para reusos da mesma camada.
+                canal = np.ascontiguousarray(canal)
+                self.canais_rgba[numero - 1] = canal
+
+            height, width = canal.shape
+            # strides[0] descreve a largura real de cada linha no buffer, sem depender de width == bytes por linha.
+            q_img = QImage(canal.data, width, height, canal.strides[0], QImage.Format.Format_Grayscale8)
+            # O buffer numpy continua vivo em canais_rgba, que é descartado junto com este cache.
+            pixmap_camada = QPixmap.fromImage(q_img)
+            self._camada_pixmap_cache[numero - 1] = pixmap_camada
         
         self.original_pixmap = pixmap_camada
         self.apply_image_filter(self.current_color_filter)
     
-    def eventFilter(self, source, event):
-        """ Intercepta eventos do mouse para implementar pan (arrastar) e zoom com scroll. """
-        if source is self.logo_centro and self.original_pixmap:
-            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
-                self._pan_active = True
-                self._pan_start = event.globalPosition().toPoint()
-                self._h0 = self.scroll_area.horizontalScrollBar().value()
-                self._v0 = self.scroll_area.verticalScrollBar().value()
-                self.logo_centro.setCursor(Qt.CursorShape.ClosedHandCursor)
-                return True
-
-            if event.type() == QEvent.Type.MouseMove and getattr(self, '_pan_active', False):
-                delta = event.globalPosition().toPoint() - self._pan_start
-                self.scroll_area.horizontalScrollBar().setValue(self._h0 - delta.x())
-                self.scroll_area.verticalScrollBar().setValue(self._v0 - delta.y())
-                return True
-
-            if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
-                self._pan_active = False
-                self.logo_centro.setCursor(Qt.CursorShape.ArrowCursor)
-                return True
-
-            if event.type() == QEvent.Type.Wheel:
-                if not self.current_processed_pixmap:
-                    return False
-
-                pos = event.position().toPoint()
-                viewport_pos = self.logo_centro.mapTo(self.scroll_area.viewport(), pos)
-                hbar = self.scroll_area.horizontalScrollBar()
-                vbar = self.scroll_area.verticalScrollBar()
-
-                w0 = self.logo_centro.width()
-                h0 = self.logo_centro.height()
-                if w0 == 0 or h0 == 0: return False
-
-                delta = event.angleDelta().y()
-                factor = 1.10 if delta > 0 else 0.90
-                
-                new_zoom = self.zoom_factor * factor
-                if new_zoom < 0.1 or new_zoom > 20.0:
-                    return True
+    def view_mouse_press(self, event):
+        """ Inicia o pan (arrastar) da imagem com o botão esquerdo. """
+        if not self.original_pixmap or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        self._pan_active = True
+        self._pan_start = event.globalPosition().toPoint()
+        self._h0 = self.scroll_area.horizontalScrollBar().value()
+        self._v0 = self.scroll_area.verticalScrollBar().value()
+        self.logo_centro.setCursor(Qt.CursorShape.ClosedHandCursor)
+        return True
 
-                self.zoom_factor = new_zoom
-                
-                self._update_image_display(smooth=False)
+    def view_mouse_move(self, event):
+        """ Move as barras de rolagem acompanhando o arrasto iniciado em view_mouse_press. """
+        if not self.original_pixmap or not getattr(self, '_pan_active', False):
+            return False
+        delta = event.globalPosition().toPoint() - self._pan_start
+        self.scroll_area.horizontalScrollBar().setValue(self._h0 - delta.x())
+        self.scroll_area.verticalScrollBar().setValue(self._v0 - delta.y())
+        return True
 
-                w1 = self.logo_centro.width()
-                h1 = self.logo_centro.height()
-                
-                new_scroll_h = int(pos.x() * (w1 / w0) - viewport_pos.x())
-                new_scroll_v = int(pos.y() * (h1 / h0) - viewport_pos.y())
-                
-                hbar.setValue(new_scroll_h)
-                vbar.setValue(new_scroll_v)
+    def view_mouse_release(self, event):
+        """ Encerra o pan ao soltar o botão esquerdo. """
+        if not self.original_pixmap or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        self._pan_active = False
+        self.logo_centro.setCursor(Qt.CursorShape.ArrowCursor)
+        return True
 
-                return True
+    def view_wheel(self, event):
+        """ Acumula o zoom da roda; o redesenho acontece uma vez por quadro em _apply_pending_zoom. """
+        if not self.original_pixmap or not self.current_processed_pixmap:
+            return False
 
-        return super().eventFilter(source, event)
+        delta = event.angleDelta().y()
+        if delta == 0:
+            return True
+
+        # A âncora só é gravada quando o zoom muda de fato e o timer vai consumi-lo; nos limites da escada nada fica pendente.
+        anchor = self._zoom_anchor
+        if anchor is None:
+            pos = event.position().toPoint()
+            viewport_pos = self.logo_centro.mapTo(self.scroll_area.viewport(), pos)
+
+            w0 = self.logo_centro.width()
+            h0 = self.logo_centro.height()
+            if w0 == 0 or h0 == 0: return False
+            anchor = (pos, viewport_pos, w0, h0)
+
+        # Um "clique" de roda vale 120; trackpads e rodas de alta resolução mandam frações e dão passos proporcionais.
+        # _zoom_step acumula o valor exato; só o fator aplicado é arredondado na escada.
+        self._zoom_step = max(self.ZOOM_MIN_STEP, min(self.ZOOM_MAX_STEP, self._zoom_step + delta / 120))
+        fraction = self.ZOOM_STEP_FRACTION
+        new_zoom = self.ZOOM_BASE ** (round(self._zoom_step * fraction) / fraction)
+        if new_zoom == self.zoom_factor:
+            return True
+
+        self.zoom_factor = new_zoom
+        self._zoom_anchor = anchor
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+        return True
+
+    def _apply_pending_zoom(self):
+        """ Redesenha uma vez o zoom acumulado pelos eventos de roda e reposiciona a rolagem mantendo o ponto sob o cursor. """
+        anchor = self._zoom_anchor
+        self._zoom_anchor = None
+        if anchor is None:
+            return
+        pos, viewport_pos, w0, h0 = anchor
+
+        self._update_image_display(smooth=False)
+        self._smooth_zoom_timer.start(self.SMOOTH_ZOOM_DELAY_MS)
+
+        w1 = self.logo_centro.width()
+        h1 = self.logo_centro.height()
+        
+        new_scroll_h = int(pos.x() * (w1 / w0) - viewport_pos.x())
+        new_scroll_v = int(pos.y() * (h1 / h0) - viewport_pos.y())
+        
+        # As duas barras movem o conteúdo separadamente; com a viewport congelada o reposicionamento vira uma única pintura.
+        viewport = self.scroll_area.viewport()
+        viewport.setUpdatesEnabled(False)
+        self.scroll_area.horizontalScrollBar().setValue(new_scroll_h)
+        self.scroll_area.verticalScrollBar().setValue(new_scroll_v)
+        viewport.setUpdatesEnabled(True)
 
     def reset_zoom(self):
         """ Restaura zoom e visualização padrão (imagem completa sem filtro/camada). """
         self.zoom_factor = 1.0
+        self._zoom_step = 0.0
+        self._zoom_timer.stop()
+        self._zoom_anchor = None
 
         for btn in self.camada_buttons:
             btn.blockSignals(True)
@@ -2657,35 +3628,41 @@ class MainWindow(QMainWindow):
     
     def set_header_mode(self):
         """ Configura o cabeçalho no modo inicial onde todos os campos expandem igualmente. """
+        if self._header_mode == 'header':
+            return
+        self._header_mode = 'header'
         policy = QSizePolicy.Policy.Expanding
         
-        self.lbl_id.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
-        self.lbl_data.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
-        self.lbl_dedo.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
-        self.lbl_frame.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
-        self.lbl_camada.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
+        self.header_widget.setUpdatesEnabled(False)
+        for lbl in (self.lbl_id, self.lbl_data, self.lbl_dedo, self.lbl_frame, self.lbl_camada):
+            lbl.setSizePolicy(policy, QSizePolicy.Policy.Preferred)
         
         self.lbl_dedo.setStyleSheet(self.style_field)
         self.lbl_camada.setStyleSheet(self.style_field)
+        self.header_widget.setUpdatesEnabled(True)
 
     def set_data_mode(self):
         """ Configura o cabeçalho no modo de dados onde Dedo e Camada expandem mais. """
+        if self._header_mode == 'data':
+            return
+        self._header_mode = 'data'
         min_policy = QSizePolicy.Policy.Minimum
         exp_policy = QSizePolicy.Policy.Expanding
         
-        self.lbl_id.setSizePolicy(min_policy, QSizePolicy.Policy.Preferred)
-        self.lbl_data.setSizePolicy(min_policy, QSizePolicy.Policy.Preferred)
-        self.lbl_frame.setSizePolicy(min_policy, QSizePolicy.Policy.Preferred)
+        self.header_widget.setUpdatesEnabled(False)
+        for lbl in (self.lbl_id, self.lbl_data, self.lbl_frame):
+            lbl.setSizePolicy(min_policy, QSizePolicy.Policy.Preferred)
         
         self.lbl_dedo.setSizePolicy(exp_policy, QSizePolicy.Policy.Preferred)
         self.lbl_camada.setSizePolicy(exp_policy, QSizePolicy.Policy.Preferred)
         
         self.lbl_dedo.setStyleSheet(self.style_field_expanded)
         self.lbl_camada.setStyleSheet(self.style_field_expanded)
+        self.header_widget.setUpdatesEnabled(True)
     
     def verificar_zip_carregado(self):
         """ Verifica se há um ZIP carregado e exibe mensagem de aviso se necessário. """
-        if not hasattr(self, 'media_files') or not self.media_files:
+        if not self.media_files:
             QMessageBox.warning(
                 self, 
                 "Ação Bloqueada", 
@@ -2695,8 +3672,15 @@ class MainWindow(QMainWindow):
         return True
     
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == "--exportar-catalogo":
+        destino = sys.argv[2] if len(sys.argv) > 2 else "catalogo_erros_formatado.json"
+        export_catalog_pretty(destino)
+        print(f"Catálogo exportado para {destino}")
+        sys.exit(0)
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    QPixmapCache.setCacheLimit(256 * 1024)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())